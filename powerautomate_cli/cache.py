@@ -0,0 +1,137 @@
+"""On-disk caches for API responses and lookup tables."""
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from .output import dumps_json, loads_json
+
+
+# Cache location
+_cache_dir = Path.home() / ".cache" / "powerautomate-cli"
+_cache_db = _cache_dir / "responses.db"
+
+# Global cache instance
+_response_cache: Optional['ResponseCache'] = None
+
+
+class ResponseCache:
+    """
+    SQLite-backed store of response bodies and their validators.
+
+    Each entry keeps the ETag and Last-Modified headers of a successful
+    response together with its raw body, so a later request can be sent
+    with If-None-Match and a 304 Not Modified answered from disk.
+    Cache failures are never fatal; they simply behave like a miss.
+    """
+
+    def __init__(self, path: Path = _cache_db):
+        """
+        Initialize the response cache.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and create the schema."""
+        if self._conn is None:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[Tuple[Optional[str], Optional[str], bytes]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (etag, last_modified, body), or None if not cached
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT etag, last_modified, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        except (sqlite3.Error, OSError):
+            return None
+        return tuple(row) if row else None
+
+    def put(self, key: str, etag: Optional[str], last_modified: Optional[str], body: bytes) -> None:
+        """
+        Store a response body with its validators.
+
+        Args:
+            key: Cache key
+            etag: ETag response header
+            last_modified: Last-Modified response header
+            body: Raw response body
+        """
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, etag, last_modified, body) VALUES (?, ?, ?, ?)",
+                    (key, etag, last_modified, body),
+                )
+        except (sqlite3.Error, OSError):
+            pass
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get or create the global response cache.
+
+    Returns:
+        ResponseCache: Shared cache instance
+    """
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
+
+
+def load_json_cache(name: str, ttl: float) -> Optional[Any]:
+    """
+    Load a JSON lookup table from the cache directory.
+
+    Args:
+        name: Cache file name (without extension)
+        ttl: Maximum age of the cache file in seconds
+
+    Returns:
+        Cached data, or None if missing, expired or unreadable
+    """
+    path = _cache_dir / f"{name}.json"
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return loads_json(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def save_json_cache(name: str, data: Any) -> None:
+    """
+    Atomically write a JSON lookup table to the cache directory.
+
+    Args:
+        name: Cache file name (without extension)
+        data: JSON-serializable data
+    """
+    path = _cache_dir / f"{name}.json"
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        _cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        temp_path.write_bytes(dumps_json(data, indent=None))
+        os.replace(temp_path, path)
+    except OSError:
+        pass
@@ -3,10 +3,11 @@ import requests
 import os
 import atexit
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, Generator, List, Tuple
 from msal import PublicClientApplication, SerializableTokenCache
 from .config import get_config
-from .output import ClientError, print_info, print_success
+from .output import ClientError, dumps_json, loads_json, print_info, print_success
+from .retry import retry_status_codes, send_with_retry
 
 
 # Global client instance
@@ -18,6 +19,9 @@ _token_cache = SerializableTokenCache()
 # Cache file location
 _cache_file = Path.home() / ".powerautomate_token_cache.bin"
 
+# How long resolved solution names are cached on disk (7 days)
+_SOLUTION_ID_TTL = 7 * 24 * 60 * 60
+
 
 def _load_cache():
     """Load the token cache from disk."""
@@ -27,10 +31,137 @@ def _load_cache():
 
 
 def _save_cache():
-    """Save the token cache to disk."""
-    if _token_cache.has_state_changed:
-        with open(_cache_file, "w") as f:
-            f.write(_token_cache.serialize())
+    """
+    Save the token cache to disk.
+
+    The cache is written to a temporary file and renamed into place so a
+    concurrent CLI invocation never reads a half-written cache and falls
+    back to interactive authentication.
+    """
+    if not _token_cache.has_state_changed:
+        return
+
+    temp_file = _cache_file.with_name(f"{_cache_file.name}.{os.getpid()}.tmp")
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(_token_cache.serialize())
+    os.replace(temp_file, _cache_file)
+    _token_cache.has_state_changed = False
+
+
+class _RetrySession(requests.Session):
+    """Session that transparently retries throttled (429, and 503 when idempotent) requests."""
+
+    def request(self, method, url, *args, **kwargs):
+        headers = requests.structures.CaseInsensitiveDict(self.headers)
+        headers.update(kwargs.get("headers") or {})
+        return send_with_retry(
+            lambda: super(_RetrySession, self).request(method, url, *args, **kwargs),
+            retry_statuses=retry_status_codes(method, headers),
+        )
+
+
+def _create_session() -> requests.Session:
+    """
+    Create an HTTP session with a keep-alive connection pool.
+
+    A single session is shared by every request a client makes, so the
+    TCP/TLS handshake is paid once per process. The pool is sized for the
+    concurrency used by paging prefetch and parallel commands. Throttled
+    requests are retried with exponential backoff and jitter, and idempotent
+    requests are retried on connection errors and transient 5xx responses.
+    The session is closed at interpreter exit.
+
+    Returns:
+        Configured requests session
+    """
+    from urllib3.util.retry import Retry
+
+    session = _RetrySession()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 504),
+        raise_on_status=False,
+        # Throttling (429/503 with Retry-After) is left to send_with_retry()
+        respect_retry_after_header=False,
+    )
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    atexit.register(session.close)
+    return session
+
+
+def _parse_response(response: requests.Response) -> Dict[str, Any]:
+    """
+    Decode a JSON response body.
+
+    Checks the raw body bytes instead of ``response.text`` so large responses
+    are not decoded to a string just to test whether the body is empty.
+
+    Args:
+        response: Response returned by the session
+
+    Returns:
+        Parsed JSON body, or an empty dictionary for empty responses
+    """
+    if not response.content:
+        return {}
+    return loads_json(response.content)
+
+
+def _iter_pages(get: Callable[..., Dict[str, Any]], endpoint: str,
+                params: Optional[Dict[str, Any]] = None, limit: Optional[int] = None,
+                next_link_keys: Tuple[str, ...] = ("nextLink", "@odata.nextLink"),
+                ) -> Generator[Dict[str, Any], None, bool]:
+    """
+    Iterate over the items of a paged collection, following its next link.
+
+    The next page is requested on a background thread while the items of
+    the current page are being consumed, so fetching overlaps processing.
+
+    Args:
+        get: Client GET method, called as get(endpoint, params=...) for the
+            first page and get(next_link) for the following ones
+        endpoint: API endpoint of the collection
+        params: Optional query parameters for the first request
+        limit: Optional maximum number of items to yield
+        next_link_keys: Response keys that may hold the next page URL
+
+    Yields:
+        Items from the 'value' array of each page
+
+    Returns:
+        True if the collection has more items than were yielded
+
+    Raises:
+        ClientError: If a request fails
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    page = get(endpoint, params=params)
+    count = 0
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            items = page.get("value", [])
+            next_link = next((page[key] for key in next_link_keys if page.get(key)), None)
+
+            # Prefetch the next page only if we still need more items
+            pending = None
+            if next_link and (limit is None or count + len(items) < limit):
+                pending = executor.submit(get, next_link)
+
+            for item in items:
+                if limit is not None and count >= limit:
+                    return True
+                yield item
+                count += 1
+
+            if pending is None:
+                return bool(next_link)
+            page = pending.result()
 
 
 # Load cache on module import
@@ -60,7 +191,8 @@ class PowerAutomateClient:
         self.environment_id = environment_id
         self.access_token = access_token
         self.api_base = "https://api.flow.microsoft.com"
-        self.session = requests.Session()
+        self.session = _create_session()
+        self._solution_ids: Dict[str, str] = {}
         self.session.headers.update({
             "Authorization": f"Bearer {self.access_token}",
             "Accept": "application/json",
@@ -68,13 +200,19 @@ class PowerAutomateClient:
             "x-ms-client-scope": "full",
         })
 
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+            cache_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Make a GET request to the Power Automate API.
 
+        When cache_key is given, the request is sent with If-None-Match using
+        the ETag of the last cached response, and a 304 Not Modified answer is
+        served from the on-disk cache.
+
         Args:
             endpoint: API endpoint (e.g., 'flows', 'connections')
             params: Optional query parameters
+            cache_key: Optional key enabling conditional request caching
 
         Returns:
             JSON response as dictionary
@@ -88,10 +226,64 @@ class PowerAutomateClient:
         else:
             url = endpoint
 
+        cache = cached = None
+        headers = {}
+        if cache_key:
+            from .cache import get_response_cache
+            cache = get_response_cache()
+            query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+            cache_key = f"{self.environment_id}:{cache_key}?{query}"
+            cached = cache.get(cache_key)
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = self.session.get(url, params=params, headers=headers)
+            response.raise_for_status()
+            if cache is not None:
+                if response.status_code == 304 and cached:
+                    return loads_json(cached[2])
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    cache.put(cache_key, etag, last_modified, response.content)
+            return _parse_response(response)
+        except requests.exceptions.HTTPError as e:
+            raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
+        except requests.exceptions.RequestException as e:
+            raise ClientError(f"Request failed: {e}")
+
+    def get_raw(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Make a GET request and return the undecoded response body.
+
+        Useful when the body is written to disk as-is (e.g. backups), which
+        avoids parsing and re-serializing large flow definitions.
+
+        Args:
+            endpoint: API endpoint (e.g., 'flows/{id}')
+            params: Optional query parameters
+
+        Returns:
+            Raw response body bytes
+
+        Raises:
+            ClientError: If the request fails
+        """
+        # Construct full URL with environment context
+        if not endpoint.startswith('http'):
+            url = f"{self.api_base}/providers/Microsoft.ProcessSimple/environments/{self.environment_id}/{endpoint}"
+        else:
+            url = endpoint
+
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return response.content
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -118,9 +310,9 @@ class PowerAutomateClient:
             url = endpoint
 
         try:
-            response = self.session.post(url, json=data)
+            response = self.session.post(url, data=dumps_json(data, indent=None))
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return _parse_response(response)
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -147,9 +339,9 @@ class PowerAutomateClient:
             url = endpoint
 
         try:
-            response = self.session.patch(url, json=data)
+            response = self.session.patch(url, data=dumps_json(data, indent=None))
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return _parse_response(response)
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -182,9 +374,9 @@ class PowerAutomateClient:
         url = f"{url}{url_separator}api-version=2016-11-01"
 
         try:
-            response = self.session.put(url, json=data)
+            response = self.session.put(url, data=dumps_json(data, indent=None))
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return _parse_response(response)
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -214,6 +406,55 @@ class PowerAutomateClient:
         except requests.exceptions.RequestException as e:
             raise ClientError(f"Request failed: {e}")
 
+    def iter_pages(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                   limit: Optional[int] = None) -> Generator[Dict[str, Any], None, bool]:
+        """
+        Iterate over the items of a paged collection, following nextLink.
+
+        The next page is requested on a background thread while the items of
+        the current page are being consumed, so fetching overlaps rendering.
+
+        Args:
+            endpoint: API endpoint (e.g., 'flows/{id}/runs')
+            params: Optional query parameters for the first request
+            limit: Optional maximum number of items to yield
+
+        Yields:
+            Items from the 'value' array of each page
+
+        Returns:
+            True if the collection has more items than were yielded
+
+        Raises:
+            ClientError: If a request fails
+        """
+        return (yield from _iter_pages(self.get, endpoint, params, limit))
+
+    def collect_pages(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                      limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Collect the items of a paged collection, following nextLink.
+
+        Args:
+            endpoint: API endpoint (e.g., 'flows/{id}/runs')
+            params: Optional query parameters for the first request
+            limit: Optional maximum number of items to collect
+
+        Returns:
+            Tuple of (items, more) where more is True if the server reported
+            further results (nextLink) beyond the collected items
+
+        Raises:
+            ClientError: If a request fails
+        """
+        pages = self.iter_pages(endpoint, params=params, limit=limit)
+        items = []
+        while True:
+            try:
+                items.append(next(pages))
+            except StopIteration as stop:
+                return items, bool(stop.value)
+
     def list_connectors(self, filter_text: Optional[str] = None, custom_only: bool = False, managed_only: bool = False) -> Dict[str, Any]:
         """
         List all connectors (custom and managed) in the environment.
@@ -238,7 +479,7 @@ class PowerAutomateClient:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            result = response.json() if response.text else {}
+            result = _parse_response(response)
 
             # Apply filters if specified
             connectors = result.get("value", [])
@@ -286,7 +527,7 @@ class PowerAutomateClient:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return _parse_response(response)
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -311,7 +552,7 @@ class PowerAutomateClient:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return _parse_response(response)
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -343,7 +584,7 @@ class PowerAutomateClient:
         try:
             response = self.session.put(url, json=definition, params=params)
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return _parse_response(response)
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -391,7 +632,7 @@ class PowerAutomateClient:
             # Use PATCH instead of PUT (this is critical for OAuth updates)
             response = self.session.patch(url, json=definition, params=params, headers=headers)
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return _parse_response(response)
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -744,7 +985,7 @@ class PowerAutomateClient:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            result = response.json() if response.text else {}
+            result = _parse_response(response)
 
             # Transform Dataverse response to match Power Apps format
             solutions = []
@@ -802,7 +1043,7 @@ class PowerAutomateClient:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            result = response.json() if response.text else {}
+            result = _parse_response(response)
 
             # Transform to Power Apps format
             return {
@@ -873,13 +1114,28 @@ class PowerAutomateClient:
             # Flow creation will fail if the solution ID is invalid
             return solution_name_or_id
 
+        # Resolved names are cached per environment, in memory and on disk
+        if solution_name_or_id in self._solution_ids:
+            return self._solution_ids[solution_name_or_id]
+
+        from .cache import load_json_cache, save_json_cache
+
+        cache_name = f"solution_ids_{self.environment_id}"
+        cached_ids = load_json_cache(cache_name, _SOLUTION_ID_TTL) or {}
+        if solution_name_or_id in cached_ids:
+            self._solution_ids[solution_name_or_id] = cached_ids[solution_name_or_id]
+            return cached_ids[solution_name_or_id]
+
         # Try to find by name (requires Dataverse API access)
-        print_info = __import__('powerautomate_cli.output', fromlist=['print_info']).print_info
         print_info("Attempting to resolve solution name (requires Dataverse API access)...")
 
         try:
             solution = self.get_solution_by_name(solution_name_or_id)
-            return solution.get("name")
+            solution_id = solution.get("name")
+            if solution_id:
+                self._solution_ids[solution_name_or_id] = solution_id
+                save_json_cache(cache_name, {**cached_ids, solution_name_or_id: solution_id})
+            return solution_id
         except ClientError as e:
             if "401" in str(e):
                 raise ClientError(
@@ -937,7 +1193,7 @@ class PowerAutomateClient:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            result = response.json() if response.text else {}
+            result = _parse_response(response)
 
             # Transform to Power Apps format
             components = []
@@ -1001,7 +1257,7 @@ class PowerAutomateClient:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return _parse_response(response)
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -1037,7 +1293,7 @@ class PowerAutomateClient:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return _parse_response(response)
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -1075,7 +1331,7 @@ class PowerAutomateClient:
         try:
             response = self.session.patch(url, json=update_data, params=params)
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return _parse_response(response)
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -1126,7 +1382,7 @@ class PowerAutomateClient:
         try:
             response = self.session.patch(url, json=update_data, params=params)
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return _parse_response(response)
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -1219,7 +1475,7 @@ class PowerAutomateClient:
         try:
             response = self.session.post(url, json=connection_data, params=params)
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return _parse_response(response)
         except requests.exceptions.HTTPError as e:
             # Provide helpful error message for permission issues
             if e.response.status_code == 403 and "does not have permission" in e.response.text:
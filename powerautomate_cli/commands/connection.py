@@ -3,7 +3,7 @@ import typer
 import json
 from typing import Optional
 from ..client import get_client
-from ..output import format_response, print_success, print_info, print_error, ClientError
+from ..output import format_response, print_success, print_info, print_error, require_interactive, api_errors
 
 
 app = typer.Typer(help="Manage Power Automate connections")
@@ -25,7 +25,7 @@ def list_connections(
         powerautomate --table connection list
         powerautomate connection list --connector shared_prg-5fpodio-5fd251d00ef0afcb57
     """
-    try:
+    with api_errors():
         client = get_client()
         result = client.list_connections(connector_id=connector_id)
 
@@ -49,10 +49,6 @@ def list_connections(
         # Use centralized output handler
         format_response(table_data, ctx, columns=["name", "id", "connector", "status", "created"])
 
-    except ClientError as e:
-        print_error(str(e))
-        raise typer.Exit(1)
-
 
 @app.command("get")
 def get_connection(
@@ -67,16 +63,12 @@ def get_connection(
     Examples:
         powerautomate connection get shared_prg-5fpodio-123456789
     """
-    try:
+    with api_errors():
         client = get_client()
         connection = client.get_connection(connection_id)
 
         format_response(connection, ctx)
 
-    except ClientError as e:
-        print_error(str(e))
-        raise typer.Exit(1)
-
 
 @app.command("refresh")
 def refresh_connection(
@@ -94,8 +86,9 @@ def refresh_connection(
         powerautomate connection refresh shared_prg-5fpodio-123456789
         powerautomate connection refresh shared_prg-5fpodio-123456789 --yes
     """
-    try:
+    with api_errors():
         if not yes:
+            require_interactive("--yes")
             confirm = typer.confirm(f"Refresh connection {connection_id}?")
             if not confirm:
                 print_info("Cancelled")
@@ -107,10 +100,6 @@ def refresh_connection(
         print_success(f"Connection {connection_id} refreshed successfully")
         format_response(result, ctx)
 
-    except ClientError as e:
-        print_error(str(e))
-        raise typer.Exit(1)
-
 
 @app.command("test")
 def test_connection(
@@ -125,7 +114,7 @@ def test_connection(
     Examples:
         powerautomate connection test shared_prg-5fpodio-123456789
     """
-    try:
+    with api_errors():
         client = get_client()
         result = client.test_connection(connection_id)
 
@@ -137,10 +126,6 @@ def test_connection(
 
         format_response(result, ctx)
 
-    except ClientError as e:
-        print_error(str(e))
-        raise typer.Exit(1)
-
 
 @app.command("update")
 def update_connection(
@@ -158,7 +143,7 @@ def update_connection(
         powerautomate connection update shared_prg-5fpodio-123456789 --auto-refresh
         powerautomate connection update shared_prg-5fpodio-123456789 --no-auto-refresh
     """
-    try:
+    with api_errors():
         client = get_client()
 
         # Build update payload
@@ -180,10 +165,6 @@ def update_connection(
             props = result.get("properties", {})
             print_info(f"Status: {props.get('statuses', [{}])[0].get('status', 'Unknown')}")
 
-    except ClientError as e:
-        print_error(str(e))
-        raise typer.Exit(1)
-
 
 @app.command("create")
 def create_connection(
@@ -209,7 +190,7 @@ def create_connection(
         powerautomate connection create shared_prg-5fpodio-5fd251d00ef0afcb57 --name "Podio Connection"
         powerautomate connection create shared_prg-5fpodio-5fd251d00ef0afcb57 -n "My Podio" --json
     """
-    try:
+    with api_errors():
         client = get_client()
 
         print_info(f"Creating connection '{display_name}' for connector {connector_id}...")
@@ -233,10 +214,6 @@ def create_connection(
         if json_output:
             format_response(result, ctx)
 
-    except ClientError as e:
-        print_error(str(e))
-        raise typer.Exit(1)
-
 
 @app.command("delete")
 def delete_connection(
@@ -253,8 +230,9 @@ def delete_connection(
         powerautomate connection delete shared_prg-5fpodio-123456789
         powerautomate connection delete shared_prg-5fpodio-123456789 --yes
     """
-    try:
+    with api_errors():
         if not yes:
+            require_interactive("--yes")
             print_error("WARNING: This will break any flows using this connection!")
             confirm = typer.confirm(f"Delete connection {connection_id}?")
             if not confirm:
@@ -266,10 +244,6 @@ def delete_connection(
 
         print_success(f"Connection {connection_id} deleted")
 
-    except ClientError as e:
-        print_error(str(e))
-        raise typer.Exit(1)
-
 
 @app.command("recreate")
 def recreate_connection(
@@ -302,12 +276,13 @@ def recreate_connection(
     print_info("4. powerautomate connection list --table (to get new connection ID)")
 
     if not yes:
+        require_interactive("--yes")
         confirm = typer.confirm("\nAttempt to recreate anyway (will likely fail)?")
         if not confirm:
             print_info("Cancelled")
             raise typer.Exit(0)
 
-    try:
+    with api_errors():
         client = get_client()
 
         # Get connection details before deleting
@@ -337,7 +312,3 @@ def recreate_connection(
         print_info("4. Complete the OAuth authentication flow")
 
         format_response(new_connection, ctx)
-
-    except ClientError as e:
-        print_error(str(e))
-        raise typer.Exit(1)
@@ -1,10 +1,13 @@
 """Power Automate connector commands using Power Apps API."""
 import json
 import typer
-import tempfile
-import subprocess
+import time
 import os
-from typing import Optional
+import shlex
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple
 from pathlib import Path
 
 from ..client import get_client
@@ -14,7 +17,10 @@ from ..output import (
     print_error,
     print_info,
     print_warning,
-    handle_api_error,
+    api_errors,
+    require_interactive,
+    dumps_json,
+    loads_json,
     ClientError,
 )
 
@@ -41,7 +47,7 @@ def list_connectors(
         powerautomate connector list --filter "podio"
         powerautomate connector list --managed --filter "sharepoint"
     """
-    try:
+    with api_errors():
         client = get_client()
 
         # Query connectors using Power Apps API
@@ -81,10 +87,6 @@ def list_connectors(
         # Use centralized output handler
         format_response(display_connectors, ctx, columns=["name", "id", "type", "publisher", "tier"])
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 @app.command("get")
 def get_connector(
@@ -103,7 +105,7 @@ def get_connector(
         powerautomate connector get shared_office365 --operations
         powerautomate connector get my_custom_connector --permissions
     """
-    try:
+    with api_errors():
         client = get_client()
 
         if permissions:
@@ -115,10 +117,6 @@ def get_connector(
 
         format_response(result, ctx)
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 @app.command("create")
 def create_connector(
@@ -137,15 +135,14 @@ def create_connector(
     Note: Only custom connectors can be created. You cannot create or modify
     Microsoft-managed connectors.
     """
-    try:
+    with api_errors():
         # Validate file exists
         if not definition_file.exists():
             raise ClientError(f"Definition file not found: {definition_file}")
 
         # Read and validate JSON
         try:
-            with open(definition_file, 'r') as f:
-                definition = json.load(f)
+            definition = loads_json(definition_file.read_bytes())
         except json.JSONDecodeError as e:
             raise ClientError(f"Invalid JSON in definition file: {e}")
 
@@ -164,10 +161,6 @@ def create_connector(
         print_success(f"Custom connector created successfully: {connector_name}")
         format_response(result, ctx)
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 @app.command("update")
 def update_connector(
@@ -243,7 +236,10 @@ def update_connector(
 
     See CONNECTOR_UPDATES.md for detailed examples and troubleshooting.
     """
-    try:
+    if not no_confirm:
+        require_interactive("--no-confirm")
+
+    with api_errors():
         client = get_client()
 
         # Determine update mode
@@ -262,10 +258,6 @@ def update_connector(
         elif edit:
             _update_connector_interactive(client, connector_id, oauth_secret, backup, no_confirm)
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 def _update_connector_from_file(client, connector_id: str, definition_file: Path, oauth_secret: Optional[str], backup: bool, no_confirm: bool):
     """Update connector from JSON definition file."""
@@ -275,8 +267,7 @@ def _update_connector_from_file(client, connector_id: str, definition_file: Path
 
     # Read and validate JSON
     try:
-        with open(definition_file, 'r') as f:
-            new_definition = json.load(f)
+        new_definition = loads_json(definition_file.read_bytes())
     except json.JSONDecodeError as e:
         raise ClientError(f"Invalid JSON in definition file: {e}")
 
@@ -293,9 +284,8 @@ def _update_connector_from_file(client, connector_id: str, definition_file: Path
 
     # Create backup if requested
     if backup:
-        backup_file = Path(f"{connector_id}_backup_{int(os.times().elapsed * 1000)}.json")
-        with open(backup_file, 'w') as f:
-            json.dump(current_connector, f, indent=2)
+        backup_file = Path(f"{connector_id}_backup_{time.time_ns() // 1_000_000}.json")
+        backup_file.write_bytes(dumps_json(current_connector))
         print_info(f"Backup created: {backup_file}")
 
     # Show what's changing (if not skipping confirmation)
@@ -338,8 +328,35 @@ def _update_connector_from_file(client, connector_id: str, definition_file: Path
     print_info("Existing connections will continue using the old schema until they are deleted and recreated.")
 
 
+@lru_cache(maxsize=None)
+def _resolve_editor(editor: str) -> Optional[Tuple[str, ...]]:
+    """
+    Resolve an $EDITOR value to an executable command.
+
+    The value may include arguments (e.g. "code --wait"); the program is
+    looked up on PATH once and cached.
+
+    Args:
+        editor: Editor command line
+
+    Returns:
+        Command as a tuple with the resolved executable path, or None if the
+        editor cannot be found
+    """
+    parts = shlex.split(editor)
+    if not parts:
+        return None
+    path = shutil.which(parts[0])
+    if path is None:
+        return None
+    return (path, *parts[1:])
+
+
 def _update_connector_interactive(client, connector_id: str, oauth_secret: Optional[str], backup: bool, no_confirm: bool):
     """Open connector definition in editor for interactive editing."""
+    import subprocess
+    import tempfile
+
     # Get current connector
     current_connector = client.get_connector(connector_id)
 
@@ -347,36 +364,52 @@ def _update_connector_interactive(client, connector_id: str, oauth_secret: Optio
     if not client._is_custom_connector(current_connector):
         raise ClientError(f"Cannot update managed connector: {connector_id}")
 
-    # Create backup if requested
-    if backup:
-        backup_file = Path(f"{connector_id}_backup_{int(os.times().elapsed * 1000)}.json")
-        with open(backup_file, 'w') as f:
-            json.dump(current_connector, f, indent=2)
-        print_info(f"Backup created: {backup_file}")
-
     # Create temporary file with current definition
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-        json.dump(current_connector, temp_file, indent=2)
+    original_bytes = dumps_json(current_connector)
+    with tempfile.NamedTemporaryFile(mode='wb', suffix='.json', delete=False) as temp_file:
+        temp_file.write(original_bytes)
         temp_path = temp_file.name
 
+    # Create backup if requested. It holds the same bytes as the temp file and
+    # is written in the background while the editor is open.
+    backup_write = None
+    if backup:
+        backup_file = Path(f"{connector_id}_backup_{time.time_ns() // 1_000_000}.json")
+        backup_executor = ThreadPoolExecutor(max_workers=1)
+        backup_write = backup_executor.submit(backup_file.write_bytes, original_bytes)
+        backup_executor.shutdown(wait=False)
+
     try:
         # Get editor from environment or use default
         editor = os.environ.get('EDITOR', 'nano')
+        editor_command = _resolve_editor(editor)
+        if editor_command is None:
+            raise ClientError(f"Editor not found: {editor} (set the EDITOR environment variable)")
 
         # Open editor
         print_info(f"Opening connector in {editor}...")
         print_info("Save and close the editor to apply changes, or exit without saving to cancel")
-        subprocess.run([editor, temp_path], check=True)
+        subprocess.run([*editor_command, temp_path], check=True, close_fds=True)
+
+        # Make sure the backup is on disk before anything else happens
+        if backup_write is not None:
+            backup_write.result()
+            print_info(f"Backup created: {backup_file}")
 
-        # Read edited content
-        with open(temp_path, 'r') as f:
-            edited_definition = json.load(f)
+        # Read edited content; an untouched file is byte-identical to what we wrote,
+        # so the common "saved without editing" case needs no parse or deep compare
+        edited_bytes = Path(temp_path).read_bytes()
+        if edited_bytes == original_bytes:
+            print_info("No changes detected")
+            raise typer.Exit(0)
+
+        edited_definition = loads_json(edited_bytes)
 
         # Validate it's still a valid connector object
         if "properties" not in edited_definition:
             raise ClientError("Edited definition must contain a 'properties' object")
 
-        # Check if anything changed
+        # Check if anything changed (e.g. only whitespace was edited)
         if edited_definition == current_connector:
             print_info("No changes detected")
             raise typer.Exit(0)
@@ -447,7 +480,10 @@ def delete_connector(
 
     Note: Only custom connectors can be deleted. You cannot delete Microsoft-managed connectors.
     """
-    try:
+    if not confirm:
+        require_interactive("--yes")
+
+    with api_errors():
         client = get_client()
 
         # Get connector to verify it's custom
@@ -464,10 +500,6 @@ def delete_connector(
         client.delete_connector(connector_id)
         print_success(f"Custom connector deleted successfully: {connector_id}")
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 @app.command("export")
 def export_connector(
@@ -489,7 +521,7 @@ def export_connector(
         powerautomate connector export shared_podio --output podio.json
         powerautomate connector export my_connector --output swagger.json --openapi
     """
-    try:
+    with api_errors():
         client = get_client()
 
         # Get connector details
@@ -505,11 +537,6 @@ def export_connector(
             export_data = result
 
         # Write to file
-        with open(output, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        output.write_bytes(dumps_json(export_data))
 
         print_success(f"Connector exported to: {output}")
-
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
@@ -1,35 +1,314 @@
 """Power Automate flow commands using Management API."""
-import json
+import re
+import sys
 import typer
-import os
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
 
-from ..client import get_client, get_dataverse_client
 from ..output import (
     format_response,
     print_success,
     print_error,
     print_info,
     print_warning,
-    handle_api_error,
+    api_errors,
+    require_interactive,
+    dumps_json,
+    loads_json,
     ClientError,
 )
 
 app = typer.Typer(help="Manage Power Automate flows via Management API")
 
+# Server-side projections for list commands (only the fields we display)
+_FLOW_LIST_SELECT = "name,properties/displayName,properties/state,properties/createdTime"
+_RUN_LIST_SELECT = "name,properties/status,properties/startTime,properties/endTime,properties/error"
+
+# Table columns, in the order _flow_row/_run_row emit their values
+_FLOW_LIST_COLUMNS = ["name", "id", "dataverse_workflow_id", "state", "created"]
+_RUN_LIST_COLUMNS = ["run_id", "status", "start_time", "end_time", "error"]
+
+_GUID_PATTERN = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+
+# Maximum number of OR-ed clauses per Dataverse $filter (keeps URLs well under length limits)
+_DATAVERSE_FILTER_CHUNK = 25
+
+# Maximum concurrent Dataverse requests when a lookup spans several chunks
+_DATAVERSE_MAX_WORKERS = 8
+
+# Maximum concurrent requests for multi-flow commands (state, batch)
+_BULK_MAX_WORKERS = 16
+
+# How long the on-disk flow ID -> Dataverse workflow ID mapping stays valid (seconds)
+_WORKFLOW_MAP_TTL = 7 * 24 * 3600
+
+_SINCE_PATTERN = re.compile(r"^\s*(\d+)\s*([mhdw])\s*$", re.IGNORECASE)
+_SINCE_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+# Static workflow definition skeleton for new flows
+_FLOW_DEFINITION_TEMPLATE = {
+    "$schema": "https://schema.management.azure.com/providers/Microsoft.Logic/schemas/2016-06-01/workflowdefinition.json#",
+    "contentVersion": "1.0.0.0",
+    "parameters": {
+        "$connections": {
+            "defaultValue": {},
+            "type": "Object"
+        },
+        "$authentication": {
+            "defaultValue": {},
+            "type": "SecureObject"
+        }
+    },
+    "triggers": {},
+    "actions": {},
+    "outputs": {}
+}
+
+# Trigger templates for `flow create --trigger`
+_HTTP_TRIGGER = {
+    "manual": {
+        "type": "Request",
+        "kind": "Http",
+        "inputs": {
+            "schema": {
+                "type": "object",
+                "properties": {}
+            }
+        }
+    }
+}
+_MANUAL_TRIGGER = {
+    "manual": {
+        "type": "Request",
+        "kind": "Button",
+        "inputs": {
+            "schema": {
+                "type": "object",
+                "properties": {}
+            }
+        }
+    }
+}
+_TRIGGERS = {
+    "http": _HTTP_TRIGGER,
+    "manual": _MANUAL_TRIGGER,
+}
+
+# Templates pre-serialized once; parsing them per call yields fresh copies and
+# is several times faster than copy.deepcopy on these pure-JSON trees
+_FLOW_DEFINITION_JSON = dumps_json(_FLOW_DEFINITION_TEMPLATE, indent=None)
+_TRIGGERS_JSON = {name: dumps_json(trigger, indent=None) for name, trigger in _TRIGGERS.items()}
+
+
+def _client():
+    """
+    Return the shared Power Automate API client.
+
+    get_client() keeps one authenticated client (and connection pool) per
+    process, so this is cheap to call from every command. The import is
+    deferred so that loading this module (e.g. for --help) does not pull
+    in requests and msal.
+    """
+    from ..client import get_client
+
+    return get_client()
+
+
+def _parse_since(value: str) -> str:
+    """
+    Convert a relative duration (e.g. 30m, 24h, 7d, 1w) to an ISO 8601 UTC timestamp.
+
+    Args:
+        value: Duration string made of a number and a unit (m, h, d or w)
+
+    Returns:
+        ISO 8601 timestamp for now minus the duration
+
+    Raises:
+        ValueError: If the duration cannot be parsed
+    """
+    from datetime import datetime, timedelta, timezone
+
+    match = _SINCE_PATTERN.match(value)
+    if not match:
+        raise ValueError(f"Invalid --since value '{value}'. Use a number followed by m, h, d or w (e.g. 24h, 7d)")
+
+    amount, unit = int(match.group(1)), match.group(2).lower()
+    since = datetime.now(timezone.utc) - timedelta(**{_SINCE_UNITS[unit]: amount})
+    return since.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _chunks(items: list, size: int):
+    """Yield successive slices of at most size items."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _query_workflows(dv_client, select: str, clauses: list) -> list:
+    """
+    Fetch workflows matching any of the given $filter clauses.
+
+    Clauses are OR-combined in chunks. When more than one chunk is needed
+    the chunk queries are packed into a single $batch request, falling back
+    to concurrent GETs if the batch is rejected.
+
+    Args:
+        dv_client: Dataverse API client
+        select: $select expression
+        clauses: Individual $filter clauses (e.g. "workflowid eq <guid>")
+
+    Returns:
+        Combined list of matching workflow records
+    """
+    chunks = list(_chunks(clauses, _DATAVERSE_FILTER_CHUNK))
+    queries = [("workflows", {"$select": select, "$filter": " or ".join(chunk)}) for chunk in chunks]
+    if len(chunks) <= 1:
+        return [wf for page in dv_client.get_many(queries) for wf in page.get("value", [])]
+
+    try:
+        from urllib.parse import quote, urlencode
+
+        endpoints = [
+            f"{endpoint}?" + urlencode(params, quote_via=quote, safe="$,")
+            for endpoint, params in queries
+        ]
+        return [wf for page in dv_client.batch_get(endpoints) for wf in page.get("value", [])]
+    except ClientError:
+        pass
+
+    pages = dv_client.get_many(queries, max_workers=_DATAVERSE_MAX_WORKERS)
+    return [wf for page in pages for wf in page.get("value", [])]
+
+
+def _map_dataverse_workflows(dv_client, flows: list) -> dict:
+    """
+    Map Power Automate flow IDs to Dataverse workflow IDs.
+
+    Flow IDs are first matched directly against workflowid; flows that are
+    not found are then matched by display name. Both lookups are sent as
+    OR-combined $filter queries instead of one request per flow.
+
+    Args:
+        dv_client: Dataverse API client
+        flows: Flow objects from the Management API
+
+    Returns:
+        Mapping of flow ID to Dataverse workflow ID
+    """
+    workflow_map = {}
+
+    # Direct lookup: the flow ID usually is the Dataverse workflow ID
+    guids = {fid.lower(): fid for fid in (f.get("name", "") for f in flows) if _GUID_PATTERN.match(fid)}
+    clauses = [f"workflowid eq {guid}" for guid in guids]
+    for wf in _query_workflows(dv_client, "workflowid", clauses):
+        workflow_id = wf.get("workflowid") or ""
+        flow_id = guids.get(workflow_id.lower())
+        if flow_id:
+            workflow_map[flow_id] = workflow_id
+
+    # Fallback: search unmapped flows by display name
+    name_to_ids = {}
+    for flow in flows:
+        flow_id = flow.get("name", "")
+        display_name = (flow.get("properties") or {}).get("displayName", "")
+        if display_name and flow_id not in workflow_map:
+            name_to_ids.setdefault(display_name, []).append(flow_id)
+
+    clauses = ["name eq '{}'".format(name.replace("'", "''")) for name in name_to_ids]
+    for wf in _query_workflows(dv_client, "workflowid,name", clauses):
+        for flow_id in name_to_ids.get(wf.get("name"), []):
+            workflow_map.setdefault(flow_id, wf.get("workflowid") or "")
+
+    return workflow_map
+
+
+def _select_or_full(fetch, params: dict):
+    """
+    Run a query with a $select projection, retrying without it on HTTP 400.
+
+    Args:
+        fetch: Callable taking query parameters and performing the request
+        params: Query parameters, possibly including $select
+
+    Returns:
+        Result of fetch()
+    """
+    try:
+        return fetch(params)
+    except ClientError as e:
+        # Fall back to complete objects if the API rejects the $select
+        if "$select" not in params or not str(e).startswith("HTTP 400"):
+            raise
+        return fetch({k: v for k, v in params.items() if k != "$select"})
+
+
+def _flow_row(flow: dict, workflow_map: dict, show_solution: bool) -> tuple:
+    """
+    Project a Management API flow object onto the `flow list` columns.
+
+    Args:
+        flow: Flow object from the API
+        workflow_map: Mapping of flow ID to Dataverse workflow ID ("" if unmapped)
+        show_solution: Whether to include the solution_id column
+
+    Returns:
+        Display row aligned with _FLOW_LIST_COLUMNS
+    """
+    flow_id = flow.get("name", "")
+    props = flow.get("properties") or {}
+    row = (
+        props.get("displayName", ""),
+        flow_id,
+        workflow_map.get(flow_id) or flow_id,
+        props.get("state", ""),
+        props.get("createdTime", ""),
+    )
+    if show_solution:
+        row += (props.get("solutionId", ""),)
+    return row
+
+
+def _run_row(run: dict) -> tuple:
+    """
+    Project a Management API run object onto the `flow runs` columns.
+
+    Args:
+        run: Run object from the API
+
+    Returns:
+        Display row aligned with _RUN_LIST_COLUMNS
+    """
+    props = run.get("properties") or {}
+    return (
+        run.get("name", ""),
+        props.get("status", ""),
+        props.get("startTime", ""),
+        props.get("endTime", ""),
+        (props.get("error") or {}).get("code", "") or "",
+    )
+
 
 @app.command("list")
 def list_flows(
     ctx: typer.Context,
     top: int = typer.Option(50, "--top", help="Number of flows to return"),
     show_solution: bool = typer.Option(False, "--show-solution", help="Show solution information in table"),
+    full: bool = typer.Option(False, "--full", help="Fetch complete flow objects instead of only the listed fields"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the local ETag response cache"),
+    refresh_cache: bool = typer.Option(False, "--refresh-cache", help="Rebuild the cached flow-to-Dataverse workflow ID mapping"),
 ):
     """
     List all Power Automate flows in the environment.
 
     This uses the Power Automate Management API to list flows and retrieves
-    corresponding Dataverse workflow IDs for detailed querying.
+    corresponding Dataverse workflow IDs for detailed querying. The workflow
+    ID mapping is cached on disk for 7 days per environment; only flows not
+    in the cache are looked up (use --refresh-cache to rebuild it).
+
+    Only the displayed fields are requested from the API ($select) to keep
+    responses small, falling back to complete objects if the API rejects the
+    projection. Use --full to fetch complete flow objects. Responses are
+    revalidated with ETags against a local cache; use --no-cache to bypass it.
 
     Examples:
         powerautomate flow list
@@ -37,12 +316,17 @@ def list_flows(
         powerautomate flow list --top 10
         powerautomate --table flow list --show-solution
     """
-    try:
-        client = get_client()
+    with api_errors():
+        client = _client()
 
         # Query flows using Power Automate API
         params = {"$top": top}
-        result = client.get("flows", params=params)
+        if not full:
+            params["$select"] = _FLOW_LIST_SELECT
+            if show_solution:
+                params["$select"] += ",properties/solutionId"
+        cache_key = None if no_cache else "flows:list"
+        result = _select_or_full(lambda p: client.get("flows", params=p, cache_key=cache_key), params)
 
         # Extract flows from response
         flows = result.get("value", [])
@@ -55,99 +339,59 @@ def list_flows(
         # All Power Automate flows have corresponding Dataverse workflows
         workflow_map = {}
         try:
-            dv_client = get_dataverse_client()
-
-            # Get all workflow IDs from Dataverse
-            # Query by workflowid to find matches
-            flow_ids = [f.get("name", "") for f in flows]
-
-            # Try direct lookup first (flow ID might match workflow ID)
-            for flow_id in flow_ids:
-                try:
-                    wf = dv_client.get(f"workflows({flow_id})", {
-                        "$select": "workflowid"
-                    })
-                    workflow_map[flow_id] = wf.get("workflowid")
-                except:
-                    # Flow ID doesn't match workflow ID directly
-                    pass
-
-            # For any unmapped flows, search by name in workflows table
-            unmapped = [fid for fid in flow_ids if fid not in workflow_map]
-            if unmapped:
-                for flow in flows:
+            from ..cache import load_json_cache, save_json_cache
+            from ..client import get_dataverse_client
+
+            cache_name = f"workflow_map_{client.environment_id}"
+            cached_map = {} if refresh_cache else (load_json_cache(cache_name, _WORKFLOW_MAP_TTL) or {})
+            workflow_map = cached_map
+
+            uncached = [f for f in flows if f.get("name", "") not in cached_map]
+            if uncached:
+                dv_client = get_dataverse_client()
+                found = _map_dataverse_workflows(dv_client, uncached)
+                # Record flows without a Dataverse workflow as "" so they are
+                # not looked up again until the cache expires
+                workflow_map = dict(cached_map)
+                for flow in uncached:
                     flow_id = flow.get("name", "")
-                    if flow_id in workflow_map:
-                        continue
-
-                    display_name = flow.get("properties", {}).get("displayName", "")
-                    if display_name:
-                        try:
-                            # Search by display name
-                            wf_result = dv_client.get("workflows", {
-                                "$select": "workflowid,name",
-                                "$filter": f"name eq '{display_name}'",
-                                "$top": 1
-                            })
-                            wf_list = wf_result.get("value", [])
-                            if wf_list:
-                                workflow_map[flow_id] = wf_list[0].get("workflowid")
-                        except:
-                            pass
-        except Exception as e:
+                    workflow_map[flow_id] = found.get(flow_id, "")
+                if workflow_map != cached_map:
+                    save_json_cache(cache_name, workflow_map)
+        except ClientError as e:
             print_info(f"Note: Could not retrieve Dataverse workflow mappings: {e}")
 
         # Build display data with dataverse_workflow_id
-        display_flows = []
-        for flow in flows:
-            flow_id = flow.get("name", "")
-            dv_workflow_id = workflow_map.get(flow_id, flow_id)
-
-            flow_data = {
-                "name": flow.get("properties", {}).get("displayName", ""),
-                "id": flow_id,
-                "dataverse_workflow_id": dv_workflow_id,
-                "state": flow.get("properties", {}).get("state", ""),
-                "created": flow.get("properties", {}).get("createdTime", ""),
-            }
-            if show_solution:
-                flow_data["solution_id"] = flow.get("properties", {}).get("solutionId", "")
-            display_flows.append(flow_data)
+        display_flows = [_flow_row(flow, workflow_map, show_solution) for flow in flows]
 
         # Define columns for table output
-        columns = ["name", "id", "dataverse_workflow_id", "state", "created"]
-        if show_solution:
-            columns.append("solution_id")
+        columns = _FLOW_LIST_COLUMNS + ["solution_id"] if show_solution else _FLOW_LIST_COLUMNS
 
         # Use centralized output handler
         format_response(display_flows, ctx, columns=columns)
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 @app.command("get")
 def get_flow(
     ctx: typer.Context,
     flow_id: str = typer.Argument(..., help="Flow ID (name, not GUID)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the local ETag response cache"),
 ):
     """
     Get detailed information about a specific flow.
 
+    Unchanged flows are served from a local cache after an ETag
+    revalidation (304 Not Modified); use --no-cache to always refetch.
+
     Examples:
         powerautomate flow get <flow-id>
         powerautomate flow get <flow-id> --file flow.json
     """
-    try:
-        client = get_client()
-        result = client.get(f"flows/{flow_id}")
+    with api_errors():
+        client = _client()
+        result = client.get(f"flows/{flow_id}", cache_key=None if no_cache else f"flows:{flow_id}")
         format_response(result, ctx)
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 @app.command("create")
 def create_flow(
@@ -157,6 +401,7 @@ def create_flow(
     solution: Optional[str] = typer.Option(None, "--solution", "-s", help="Solution unique name or ID"),
     solution_id: Optional[str] = typer.Option(None, "--solution-id", help="Solution ID (GUID) - alternative to --solution"),
     description: Optional[str] = typer.Option(None, "--description", "-d", help="Flow description"),
+    json_output: bool = typer.Option(False, "--json", help="Print the created flow details as JSON"),
 ):
     """
     Create a new Power Automate flow using the Management API.
@@ -164,13 +409,17 @@ def create_flow(
     This properly registers the flow with the Power Automate service,
     ensuring it has a resourceid and appears in the portal.
 
+    Prints a single confirmation line by default. Structured output is
+    emitted with --json, or when the global --file/--table options are used.
+
     Examples:
         powerautomate flow create --name "My Flow" --trigger http
+        powerautomate flow create --name "My Flow" --trigger http --json
         powerautomate flow create --name "My Flow" --trigger http --solution ProgressContentAutomation
         powerautomate flow create --name "My Flow" --trigger http --solution-id <guid>
     """
-    try:
-        client = get_client()
+    with api_errors():
+        client = _client()
 
         # Resolve solution if specified
         resolved_solution_id = None
@@ -182,54 +431,14 @@ def create_flow(
             print_info(f"Solution ID: {resolved_solution_id}")
 
         # Build flow definition based on trigger type
-        if trigger.lower() == "http":
-            trigger_def = {
-                "manual": {
-                    "type": "Request",
-                    "kind": "Http",
-                    "inputs": {
-                        "schema": {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    }
-                }
-            }
-        elif trigger.lower() == "manual":
-            trigger_def = {
-                "manual": {
-                    "type": "Request",
-                    "kind": "Button",
-                    "inputs": {
-                        "schema": {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    }
-                }
-            }
-        else:
-            print_error(f"Unsupported trigger type: {trigger}")
+        trigger_json = _TRIGGERS_JSON.get(trigger.lower())
+        if trigger_json is None:
+            print_error(f"Unsupported trigger type: {trigger} (supported: {', '.join(_TRIGGERS)})")
             raise typer.Exit(1)
 
-        # Build flow definition
-        flow_definition = {
-            "$schema": "https://schema.management.azure.com/providers/Microsoft.Logic/schemas/2016-06-01/workflowdefinition.json#",
-            "contentVersion": "1.0.0.0",
-            "parameters": {
-                "$connections": {
-                    "defaultValue": {},
-                    "type": "Object"
-                },
-                "$authentication": {
-                    "defaultValue": {},
-                    "type": "SecureObject"
-                }
-            },
-            "triggers": trigger_def,
-            "actions": {},
-            "outputs": {}
-        }
+        # Build flow definition from fresh copies of the shared templates
+        flow_definition = loads_json(_FLOW_DEFINITION_JSON)
+        flow_definition["triggers"] = loads_json(trigger_json)
 
         # Build request payload for Power Automate API
         flow_data = {
@@ -254,7 +463,10 @@ def create_flow(
         flow_id = result.get("name")
         flow_name = result.get("properties", {}).get("displayName")
 
-        print_success(f"Flow created successfully: {flow_id}")
+        structured = json_output or bool(ctx.obj and (ctx.obj.get('output_file') or ctx.obj.get('output_table')))
+        if not structured:
+            print_success(f"Flow created successfully: {flow_id} (name: {flow_name}, trigger: {trigger})")
+            return
 
         result_info = {"flow_id": flow_id, "name": flow_name, "trigger": trigger}
         if resolved_solution_id:
@@ -262,10 +474,6 @@ def create_flow(
 
         format_response(result_info, ctx)
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 @app.command("update")
 def update_flow(
@@ -278,13 +486,15 @@ def update_flow(
     definition_file: Optional[Path] = typer.Option(None, "--definition-file", "-f", help="JSON file with flow definition"),
     no_confirm: bool = typer.Option(False, "--no-confirm", "--yes", "-y", help="Skip confirmation prompts"),
     backup: bool = typer.Option(True, "--backup/--no-backup", help="Create backup before updating"),
+    full_patch: bool = typer.Option(False, "--full-patch", help="Send the full flow object for property updates instead of only changed fields"),
 ):
     """
     Update an existing Power Automate flow.
 
     This command supports two update modes:
 
-    1. Property updates (PATCH): Update name, state, or solution
+    1. Property updates (PATCH): Update name, state, or solution. Only the
+       changed fields are sent; use --full-patch to send the full flow object
     2. Definition file (PATCH): Update complete flow from JSON file
 
     Examples:
@@ -302,8 +512,11 @@ def update_flow(
         # Don't create backup
         powerautomate flow update <flow-id> --definition-file flow.json --no-backup
     """
-    try:
-        client = get_client()
+    if definition_file and not no_confirm:
+        require_interactive("--no-confirm")
+
+    with api_errors():
+        client = _client()
 
         # Determine update mode
         is_definition_update = definition_file is not None
@@ -321,17 +534,13 @@ def update_flow(
 
         # Property updates use PATCH (simpler, only specified fields)
         if is_property_update:
-            _update_flow_properties(client, flow_id, name, description, state, solution, solution_id)
+            _update_flow_properties(client, flow_id, name, description, state, solution, solution_id, full_patch)
             return
 
         # Definition updates use PUT (complete flow object)
         if definition_file:
             _update_flow_from_file(client, flow_id, definition_file, backup, no_confirm)
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 def _update_flow_properties(
     client,
@@ -341,12 +550,15 @@ def _update_flow_properties(
     state: Optional[str],
     solution: Optional[str],
     solution_id: Optional[str],
+    full_patch: bool = False,
 ):
-    """Update flow properties using PATCH with full flow object."""
-    # Power Automate API requires full flow object for PATCH
-    # Get current flow first
-    current_flow = client.get(f"flows/{flow_id}")
+    """
+    Update flow properties using PATCH.
 
+    By default only the changed fields are sent. With full_patch the current
+    flow is fetched and the complete object is sent back with the changes
+    applied, for environments that reject partial updates.
+    """
     # Resolve solution if specified
     resolved_solution_id = None
     if solution_id:
@@ -356,19 +568,24 @@ def _update_flow_properties(
         resolved_solution_id = client.resolve_solution_id(solution)
         print_info(f"Solution ID: {resolved_solution_id}")
 
-    # Update specific properties
+    # Collect only the properties being changed
+    properties = {}
     if name:
-        current_flow["properties"]["displayName"] = name
+        properties["displayName"] = name
     if description:
-        current_flow["properties"]["description"] = description
+        properties["description"] = description
     if state:
-        state_value = "Started" if state.lower() == "started" else "Stopped"
-        current_flow["properties"]["state"] = state_value
+        properties["state"] = "Started" if state.lower() == "started" else "Stopped"
     if resolved_solution_id:
-        current_flow["properties"]["solutionId"] = resolved_solution_id
-
-    # Send PATCH with full flow object
-    client.patch(f"flows/{flow_id}", current_flow)
+        properties["solutionId"] = resolved_solution_id
+
+    if full_patch:
+        current_flow = client.get(f"flows/{flow_id}")
+        current_flow.setdefault("properties", {}).update(properties)
+        client.patch(f"flows/{flow_id}", current_flow)
+    else:
+        # PATCH merges the given properties into the flow; no prior GET is needed
+        _patch_flow(client, flow_id, **properties)
     print_success(f"Flow properties updated successfully: {flow_id}")
 
     if resolved_solution_id:
@@ -377,14 +594,16 @@ def _update_flow_properties(
 
 def _update_flow_from_file(client, flow_id: str, definition_file: Path, backup: bool, no_confirm: bool):
     """Update flow from JSON definition file using PATCH."""
+    import json
+    import time
+
     # Validate file exists
     if not definition_file.exists():
         raise ClientError(f"Definition file not found: {definition_file}")
 
     # Read and validate JSON
     try:
-        with open(definition_file, 'r') as f:
-            new_definition = json.load(f)
+        new_definition = loads_json(definition_file.read_bytes())
     except json.JSONDecodeError as e:
         raise ClientError(f"Invalid JSON in definition file: {e}")
 
@@ -392,15 +611,18 @@ def _update_flow_from_file(client, flow_id: str, definition_file: Path, backup:
     if "properties" not in new_definition:
         raise ClientError("Definition file must contain a 'properties' object")
 
-    # Get current flow for backup and comparison
-    current_flow = client.get(f"flows/{flow_id}")
-
-    # Create backup if requested
+    # Get current flow for backup and comparison. The backup is written from
+    # the raw response body; the flow is only parsed when it is displayed.
+    current_flow = None
     if backup:
-        backup_file = Path(f"{flow_id}_backup_{int(os.times().elapsed * 1000)}.json")
-        with open(backup_file, 'w') as f:
-            json.dump(current_flow, f, indent=2)
+        raw_flow = client.get_raw(f"flows/{flow_id}")
+        backup_file = Path(f"{flow_id}_backup_{time.time_ns() // 1_000_000}.json")
+        backup_file.write_bytes(raw_flow)
         print_info(f"Backup created: {backup_file}")
+        if not no_confirm:
+            current_flow = loads_json(raw_flow)
+    elif not no_confirm:
+        current_flow = client.get(f"flows/{flow_id}")
 
     # Show what's changing (if not skipping confirmation)
     if not no_confirm:
@@ -437,83 +659,305 @@ def delete_flow(
     """
     Delete a Power Automate flow.
 
+    When stdin is not a terminal (scripts, pipes), --yes is required
+    instead of an interactive confirmation prompt.
+
     Examples:
         powerautomate flow delete <flow-id>
         powerautomate flow delete <flow-id> --yes
     """
-    try:
-        if not confirm:
-            confirmed = typer.confirm(f"Are you sure you want to delete flow {flow_id}?")
-            if not confirmed:
-                print_error("Delete cancelled")
-                raise typer.Exit(0)
+    if not confirm:
+        require_interactive("--yes")
+        confirmed = typer.confirm(f"Are you sure you want to delete flow {flow_id}?")
+        if not confirmed:
+            print_error("Delete cancelled")
+            raise typer.Exit(0)
 
-        client = get_client()
+    with api_errors():
+        client = _client()
         client.delete(f"flows/{flow_id}")
         print_success(f"Flow deleted successfully: {flow_id}")
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+
+def _patch_flow(client, flow_id: str, **properties) -> dict:
+    """
+    Send a sparse PATCH of flow properties.
+
+    Args:
+        client: Power Automate API client
+        flow_id: Flow ID (name)
+        **properties: Flow properties to set (e.g. state="Started")
+
+    Returns:
+        Updated flow object returned by the API
+    """
+    return client.patch(f"flows/{flow_id}", {"properties": properties})
+
+
+def _run_parallel(operation, flow_ids: List[str]) -> dict:
+    """
+    Run an operation for several flows concurrently.
+
+    Args:
+        operation: Callable taking a flow ID
+        flow_ids: Flow IDs (names)
+
+    Returns:
+        Mapping of flow ID to the ClientError it raised, or None on success,
+        in the order of flow_ids
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def run(flow_id):
+        try:
+            operation(flow_id)
+            return None
+        except ClientError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max(1, min(_BULK_MAX_WORKERS, len(flow_ids)))) as executor:
+        return dict(zip(flow_ids, executor.map(run, flow_ids)))
+
+
+def _get_flow_state(client, flow_id: str) -> str:
+    """
+    Get the current state of a flow (e.g. 'Started', 'Stopped').
+
+    Uses the ETag response cache, so repeated checks of an unchanged flow
+    are answered with a 304 instead of a full flow definition.
+
+    Args:
+        client: Power Automate API client
+        flow_id: Flow ID (name)
+
+    Returns:
+        Flow state, or an empty string if unknown
+    """
+    flow = client.get(f"flows/{flow_id}", cache_key=f"flows:{flow_id}")
+    return (flow.get("properties") or {}).get("state", "")
 
 
 @app.command("start")
 def start_flow(
     flow_id: str = typer.Argument(..., help="Flow ID (name)"),
+    force: bool = typer.Option(False, "--force", help="Send the update without checking the current state"),
 ):
     """
     Start (turn on) a Power Automate flow.
 
+    The current state is checked first and no update is sent if the flow
+    is already started. Use --force to skip the check.
+
     Examples:
         powerautomate flow start <flow-id>
+        powerautomate flow start <flow-id> --force
     """
-    try:
-        client = get_client()
-        update_data = {"properties": {"state": "Started"}}
-        client.patch(f"flows/{flow_id}", update_data)
-        print_success(f"Flow started successfully: {flow_id}")
+    with api_errors():
+        client = _client()
+        if not force and _get_flow_state(client, flow_id) == "Started":
+            print_info(f"Flow is already started: {flow_id}")
+            return
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+        _patch_flow(client, flow_id, state="Started")
+        print_success(f"Flow started successfully: {flow_id}")
 
 
 @app.command("stop")
 def stop_flow(
     flow_id: str = typer.Argument(..., help="Flow ID (name)"),
+    force: bool = typer.Option(False, "--force", help="Send the update without checking the current state"),
 ):
     """
     Stop (turn off) a Power Automate flow.
 
+    The current state is checked first and no update is sent if the flow
+    is already stopped. Use --force to skip the check.
+
     Examples:
         powerautomate flow stop <flow-id>
+        powerautomate flow stop <flow-id> --force
     """
-    try:
-        client = get_client()
-        update_data = {"properties": {"state": "Stopped"}}
-        client.patch(f"flows/{flow_id}", update_data)
+    with api_errors():
+        client = _client()
+        if not force and _get_flow_state(client, flow_id) == "Stopped":
+            print_info(f"Flow is already stopped: {flow_id}")
+            return
+
+        _patch_flow(client, flow_id, state="Stopped")
         print_success(f"Flow stopped successfully: {flow_id}")
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+
+def _read_flow_ids(ids_file: Path) -> List[str]:
+    """
+    Read flow IDs from a file, one per line.
+
+    Blank lines and lines starting with # are ignored.
+
+    Args:
+        ids_file: File to read, or '-' for stdin
+
+    Returns:
+        Flow IDs in file order
+    """
+    try:
+        text = sys.stdin.read() if str(ids_file) == "-" else ids_file.read_text(encoding="utf-8")
+    except OSError as e:
+        print_error(f"Could not read flow IDs: {e}")
+        raise typer.Exit(1)
+
+    lines = (line.strip() for line in text.splitlines())
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def _report_results(ctx: typer.Context, action: str, errors: dict):
+    """
+    Report the outcome of a multi-flow operation as one result list.
+
+    Exits with code 2 if any flow failed.
+
+    Args:
+        ctx: Typer context
+        action: Action that was applied (e.g. 'start', 'delete')
+        errors: Mapping of flow ID to error or None, as returned by _run_parallel()
+    """
+    results = [
+        {
+            "flow_id": flow_id,
+            "action": action,
+            "status": "failed" if error else "succeeded",
+            "error": str(error) if error else "",
+        }
+        for flow_id, error in errors.items()
+    ]
+    format_response(results, ctx, columns=["flow_id", "action", "status", "error"])
+
+    failed = sum(1 for error in errors.values() if error)
+    if failed:
+        print_error(f"{failed} of {len(errors)} operations failed")
+        raise typer.Exit(2)
+
+
+@app.command("state")
+def set_flow_state(
+    ctx: typer.Context,
+    flow_ids: Optional[List[str]] = typer.Argument(None, help="One or more flow IDs (names)"),
+    start: bool = typer.Option(..., "--start/--stop", help="Turn the flows on (--start) or off (--stop)"),
+    ids_file: Optional[Path] = typer.Option(
+        None, "--ids-file", help="File with one flow ID per line ('-' reads stdin)"
+    ),
+):
+    """
+    Start or stop several Power Automate flows at once.
+
+    Flow IDs can be given as arguments, in a file with --ids-file, or both.
+    The state changes are sent in parallel, so toggling N flows takes
+    roughly one round trip instead of N, and the outcome for every flow is
+    reported in a single result list.
+
+    Examples:
+        powerautomate flow state <flow-id-1> <flow-id-2> --start
+        powerautomate flow state <flow-id-1> <flow-id-2> <flow-id-3> --stop
+        powerautomate --table flow state --ids-file flows.txt --stop
+        cat flows.txt | powerautomate flow state --ids-file - --start
+    """
+    ids = list(flow_ids or [])
+    if ids_file is not None:
+        ids.extend(_read_flow_ids(ids_file))
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        print_error("No flow IDs given (pass them as arguments or with --ids-file)")
+        raise typer.Exit(1)
+
+    state = "Started" if start else "Stopped"
+
+    with api_errors():
+        client = _client()
+
+    errors = _run_parallel(lambda flow_id: _patch_flow(client, flow_id, state=state), ids)
+    _report_results(ctx, "start" if start else "stop", errors)
+
+
+# Operations available to `flow batch --action`; start and stop are
+# covered by `flow state --ids-file`
+_BATCH_ACTIONS = {
+    "delete": lambda client, flow_id: client.delete(f"flows/{flow_id}"),
+}
+
+
+@app.command("batch")
+def batch_flows(
+    ctx: typer.Context,
+    ids_file: Path = typer.Option(..., "--ids-file", help="File with one flow ID per line ('-' reads stdin)"),
+    action: str = typer.Option(..., "--action", help="Action to apply: delete"),
+    confirm: bool = typer.Option(False, "--yes", "-y", help="Skip the confirmation prompt for delete"),
+):
+    """
+    Apply one action to many flows listed in a file.
+
+    Requests are sent concurrently over the shared connection pool and the
+    outcome for every flow is reported in a single result list. Blank lines
+    and lines starting with # are ignored. To start or stop flows from a
+    file, use `flow state --ids-file`.
+
+    Examples:
+        powerautomate flow batch --ids-file flows.txt --action delete
+        cat flows.txt | powerautomate flow batch --ids-file - --action delete --yes
+    """
+    action = action.lower()
+    operation = _BATCH_ACTIONS.get(action)
+    if operation is None:
+        if action in ("start", "stop"):
+            print_error(f"Use 'flow state --ids-file' to {action} flows listed in a file")
+        else:
+            print_error(f"Unsupported action: {action} (supported: {', '.join(_BATCH_ACTIONS)})")
+        raise typer.Exit(1)
+
+    flow_ids = list(dict.fromkeys(_read_flow_ids(ids_file)))
+    if not flow_ids:
+        print_error(f"No flow IDs found in {ids_file}")
+        raise typer.Exit(1)
+
+    if action == "delete" and not confirm:
+        require_interactive("--yes")
+        if not typer.confirm(f"Are you sure you want to delete {len(flow_ids)} flows?"):
+            print_error("Delete cancelled")
+            raise typer.Exit(0)
+
+    with api_errors():
+        client = _client()
+
+    errors = _run_parallel(lambda flow_id: operation(client, flow_id), flow_ids)
+    _report_results(ctx, action, errors)
 
 
 @app.command("runs")
 def list_runs(
     ctx: typer.Context,
     flow_id: str = typer.Argument(..., help="Flow ID (name)"),
-    top: int = typer.Option(50, "--top", help="Number of runs to return (max 100)"),
+    top: int = typer.Option(50, "--top", help="Number of runs to return (pages are followed beyond 100)"),
     status_filter: Optional[str] = typer.Option(None, "--filter", help="Filter by status (e.g., 'Succeeded', 'Failed', 'Running')"),
     failed: bool = typer.Option(False, "--failed", help="Show only failed runs"),
     succeeded: bool = typer.Option(False, "--succeeded", help="Show only successful runs"),
     running: bool = typer.Option(False, "--running", help="Show only running flows"),
+    since: Optional[str] = typer.Option(None, "--since", help="Only runs started within this window (e.g. 30m, 24h, 7d, 1w)"),
+    full: bool = typer.Option(False, "--full", help="Fetch complete run objects instead of only the listed fields"),
+    all_runs: bool = typer.Option(False, "--all", help="Return every retained run, ignoring --top"),
 ):
     """
     List run history for a specific flow.
 
     Power Automate retains the last 28 days of run history.
-    API returns maximum 100 runs per request.
+    API returns maximum 100 runs per request; larger --top values follow
+    nextLink and prefetch the next page while the current one is processed.
+    Use --all to walk every page of the retained history.
+
+    Use --since to narrow the window server-side; `--failed --since 24h` is
+    the recommended way to triage recent failures without paging through
+    the full history.
+
+    Only the displayed fields are requested from the API ($select) to keep
+    responses small, falling back to complete objects if the API rejects the
+    projection. Use --full to fetch complete run objects.
 
     Examples:
         powerautomate flow runs <flow-id>
@@ -521,10 +965,12 @@ def list_runs(
         powerautomate --table flow runs <flow-id> --failed
         powerautomate flow runs <flow-id> --succeeded --top 10
         powerautomate flow runs <flow-id> --filter "status eq 'Failed'"
+        powerautomate --table flow runs <flow-id> --failed --since 24h
+        powerautomate flow runs <flow-id> --all --since 7d
     """
-    try:
+    with api_errors():
         # Use Power Automate Management API for flow runs
-        client = get_client()
+        client = _client()
 
         # Build Power Automate API endpoint (client.get() prepends environment path)
         endpoint = f"flows/{flow_id}/runs"
@@ -532,8 +978,10 @@ def list_runs(
         # Build query parameters
         params = {
             "api-version": "2016-11-01",
-            "$top": min(top, 100)
+            "$top": 100 if all_runs else min(top, 100)
         }
+        if not full:
+            params["$select"] = _RUN_LIST_SELECT
 
         # Add status filter if specified
         if failed:
@@ -545,46 +993,32 @@ def list_runs(
         elif status_filter:
             params["$filter"] = status_filter
 
-        # Query flow runs from Power Automate Management API
-        result = client.get(endpoint, params=params)
+        # Restrict the time window server-side, AND-ing with any status filter
+        if since:
+            since_filter = f"startTime gt {_parse_since(since)}"
+            if "$filter" in params:
+                params["$filter"] = f"({params['$filter']}) and {since_filter}"
+            else:
+                params["$filter"] = since_filter
 
-        # Extract runs from response
-        runs = result.get("value", [])
+        # Query flow runs from Power Automate Management API, following nextLink up to --top
+        limit = None if all_runs else top
+        runs, more = _select_or_full(lambda p: client.collect_pages(endpoint, params=p, limit=limit), params)
 
         if not runs:
             print_error("No runs found")
             return
 
         # Build display data
-        display_runs = []
-        for run in runs:
-            # Power Automate API fields
-            props = run.get("properties", {})
-            run_name = run.get("name", "")
-            status = props.get("status", "")
-            start_time = props.get("startTime", "")
-            end_time = props.get("endTime", "")
-            error = props.get("error", {}).get("code", "") or ""
-
-            display_runs.append({
-                "run_id": run_name,
-                "status": status,
-                "start_time": start_time,
-                "end_time": end_time,
-                "error": error
-            })
+        display_runs = [_run_row(run) for run in runs]
 
         # Use centralized output handler
-        format_response(display_runs, ctx, columns=["run_id", "status", "start_time", "end_time", "error"])
+        format_response(display_runs, ctx, columns=_RUN_LIST_COLUMNS)
 
-        # Show pagination info
-        if len(runs) == top:
+        # Show pagination info (nextLink is the authoritative signal)
+        if more:
             print_info(f"More results available. Showing first {len(runs)} runs.")
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 @app.command("run")
 def get_run(
@@ -599,15 +1033,11 @@ def get_run(
         powerautomate flow run <flow-id> <run-id>
         powerautomate flow run <flow-id> <run-id> --file run.json
     """
-    try:
-        client = get_client()
+    with api_errors():
+        client = _client()
 
         # Get specific run details
         params = {"api-version": "2016-11-01"}
         result = client.get(f"flows/{flow_id}/runs/{run_id}", params=params)
 
         format_response(result, ctx)
-
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
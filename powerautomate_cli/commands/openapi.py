@@ -7,18 +7,32 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from openapi_spec_validator import validate_spec
-from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
-from openapi_spec_validator import (
-    OpenAPIV2SpecValidator,
-    OpenAPIV30SpecValidator,
-    OpenAPIV31SpecValidator
-)
 
-from ..output import print_success, print_error, print_info, print_warning
+from ..output import print_success, print_error, print_info, print_warning, loads_json
 
 app = typer.Typer(help="OpenAPI specification validation and manipulation")
 
+# Validator class (in openapi_spec_validator) for each major.minor spec version
+_VALIDATORS = {
+    "2.0": "OpenAPIV2SpecValidator",
+    "3.0": "OpenAPIV30SpecValidator",
+    "3.1": "OpenAPIV31SpecValidator",
+}
+
+
+def _print_spec_stats(spec: dict):
+    """Print path and schema/definition counts for a parsed spec."""
+    if 'paths' in spec:
+        path_count = len(spec['paths'])
+        print_info(f"  Paths: {path_count}")
+
+    if 'components' in spec and 'schemas' in spec['components']:
+        schema_count = len(spec['components']['schemas'])
+        print_info(f"  Schemas: {schema_count}")
+    elif 'definitions' in spec:
+        schema_count = len(spec['definitions'])
+        print_info(f"  Definitions: {schema_count}")
+
 
 @app.command("validate")
 def validate_openapi(
@@ -26,6 +40,7 @@ def validate_openapi(
     spec_version: Optional[str] = typer.Option("2.0", "--version", "-v", help="Force specific OpenAPI version (2.0, 3.0, 3.1). Defaults to 2.0 (Swagger) for Power Automate compatibility"),
     base_uri: str = typer.Option("", "--base-uri", "-b", help="Base URI for resolving $ref references"),
     show_details: bool = typer.Option(False, "--details", "-d", help="Show detailed validation errors"),
+    summary_only: bool = typer.Option(False, "--summary-only", help="Only report version and path/schema counts; skip schema validation"),
 ):
     """
     Validate an OpenAPI specification file.
@@ -50,7 +65,14 @@ def validate_openapi(
 
         # Show detailed error messages
         powerautomate openapi validate spec.json --details
+
+        # Quick summary of a large spec without full validation
+        powerautomate openapi validate spec.json --summary-only
     """
+    # Imported here: the validator pulls in jsonschema and is slow to load
+    import openapi_spec_validator
+    from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
+
     try:
         # Check if file exists
         if not spec_file.exists():
@@ -59,53 +81,46 @@ def validate_openapi(
 
         # Read the spec file
         print_info(f"Reading spec file: {spec_file}")
-        with open(spec_file, 'r') as f:
-            if spec_file.suffix.lower() in ['.yaml', '.yml']:
-                import yaml
+        if spec_file.suffix.lower() in ['.yaml', '.yml']:
+            import yaml
+            with open(spec_file, 'r') as f:
                 spec = yaml.safe_load(f)
-            else:
-                spec = json.load(f)
+        else:
+            spec = loads_json(spec_file.read_bytes())
 
         # Determine validator class based on version
-        validator_cls = None
-        detected_version = None
-
         if 'swagger' in spec:
             detected_version = f"Swagger {spec.get('swagger', 'unknown')}"
-            if spec_version == "2.0" or spec_version is None:
-                validator_cls = OpenAPIV2SpecValidator
+            ver_key = "2.0" if spec_version in (None, "2.0") else None
         elif 'openapi' in spec:
-            openapi_version = spec.get('openapi', 'unknown')
+            openapi_version = str(spec.get('openapi', 'unknown'))
             detected_version = f"OpenAPI {openapi_version}"
-
-            if spec_version:
-                # User specified version
-                if spec_version == "3.0":
-                    validator_cls = OpenAPIV30SpecValidator
-                elif spec_version == "3.1":
-                    validator_cls = OpenAPIV31SpecValidator
-                elif spec_version == "2.0":
-                    print_warning(f"Spec declares OpenAPI {openapi_version} but forcing Swagger 2.0 validation")
-                    validator_cls = OpenAPIV2SpecValidator
-            else:
-                # Auto-detect from version string
-                if openapi_version.startswith('3.0'):
-                    validator_cls = OpenAPIV30SpecValidator
-                elif openapi_version.startswith('3.1'):
-                    validator_cls = OpenAPIV31SpecValidator
+            if spec_version == "2.0":
+                print_warning(f"Spec declares OpenAPI {openapi_version} but forcing Swagger 2.0 validation")
+            ver_key = spec_version or openapi_version[:3]
         else:
             print_error("Unable to determine OpenAPI/Swagger version from spec file")
             print_info("Spec must contain 'swagger' or 'openapi' field")
             raise typer.Exit(1)
 
+        validator_name = _VALIDATORS.get(ver_key)
+        validator_cls = getattr(openapi_spec_validator, validator_name) if validator_name else None
+
         print_info(f"Detected version: {detected_version}")
+
+        if summary_only:
+            print_info(f"  File: {spec_file}")
+            _print_spec_stats(spec)
+            print_warning("Schema validation skipped (--summary-only)")
+            return
+
         if validator_cls:
             print_info(f"Using validator: {validator_cls.__name__}")
 
         # Validate the spec
         print_info("Validating specification...")
         try:
-            validate_spec(
+            openapi_spec_validator.validate_spec(
                 spec,
                 base_uri=base_uri,
                 cls=validator_cls,
@@ -117,16 +132,7 @@ def validate_openapi(
             print_info(f"  File: {spec_file}")
 
             # Show some basic stats
-            if 'paths' in spec:
-                path_count = len(spec['paths'])
-                print_info(f"  Paths: {path_count}")
-
-            if 'components' in spec and 'schemas' in spec['components']:
-                schema_count = len(spec['components']['schemas'])
-                print_info(f"  Schemas: {schema_count}")
-            elif 'definitions' in spec:
-                schema_count = len(spec['definitions'])
-                print_info(f"  Definitions: {schema_count}")
+            _print_spec_stats(spec)
 
         except OpenAPIValidationError as e:
             print_error("✗ OpenAPI specification validation failed!")
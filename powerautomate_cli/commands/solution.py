@@ -9,23 +9,82 @@ These commands provide basic solution querying functionality for convenience.
 import typer
 from typing import Optional
 
-from ..client import get_client
 from ..output import (
     format_response,
     print_success,
     print_error,
     print_info,
     print_warning,
-    handle_api_error,
+    api_errors,
 )
 
 app = typer.Typer(help="Manage Power Platform solutions")
 
 
+def _client():
+    """
+    Return the shared Power Automate API client.
+
+    Imported lazily so that registering the solution commands at startup
+    does not pull in requests and msal.
+    """
+    from ..client import get_client
+
+    return get_client()
+
+
+# Parameters shared by several commands, declared once
+_SOLUTION_ARGUMENT = typer.Argument(..., help="Solution ID or unique name")
+_BY_NAME_OPTION = typer.Option(False, "--name", help="Treat argument as solution unique name")
+_TABLE_OPTION = typer.Option(False, "--table", "-t", help="Display as table")
+
+# Table columns, in the order the _*_row helpers emit their values
+_SOLUTION_COLUMNS = ["displayName", "uniqueName", "id", "version", "publisher"]
+_COMPONENT_COLUMNS = ["displayName", "type", "id", "createdTime"]
+_SOLUTION_FLOW_COLUMNS = ["displayName", "id", "state", "createdTime"]
+
+# Shared read-only stand-in for a missing properties object
+_NO_PROPERTIES: dict = {}
+
+
+def _solution_row(solution: dict) -> tuple:
+    """Project a solution onto _SOLUTION_COLUMNS."""
+    props = solution.get("properties") or _NO_PROPERTIES
+    return (
+        props.get("displayName", ""),
+        props.get("uniqueName", ""),
+        solution.get("name", ""),
+        props.get("version", ""),
+        props.get("publisherName", ""),
+    )
+
+
+def _component_row(component: dict) -> tuple:
+    """Project a solution component onto _COMPONENT_COLUMNS."""
+    props = component.get("properties") or _NO_PROPERTIES
+    return (
+        props.get("displayName", ""),
+        component.get("type", ""),
+        component.get("name", ""),
+        props.get("createdTime", ""),
+    )
+
+
+def _solution_flow_row(flow: dict) -> tuple:
+    """Project a solution flow onto _SOLUTION_FLOW_COLUMNS."""
+    props = flow.get("properties") or _NO_PROPERTIES
+    return (
+        props.get("displayName", ""),
+        flow.get("name", ""),
+        props.get("state", ""),
+        props.get("createdTime", ""),
+    )
+
+
 @app.command("list")
 def list_solutions(
     ctx: typer.Context,
-    table_format: bool = typer.Option(False, "--table", "-t", help="Display as table"),
+    table_format: bool = _TABLE_OPTION,
     filter_text: Optional[str] = typer.Option(None, "--filter", "-f", help="Filter solutions by name"),
 ):
     """
@@ -36,8 +95,8 @@ def list_solutions(
         powerautomate solution list --table
         powerautomate solution list --filter "Progress"
     """
-    try:
-        client = get_client()
+    with api_errors():
+        client = _client()
         result = client.list_solutions(filter_text=filter_text)
 
         # Extract solutions from response
@@ -49,30 +108,17 @@ def list_solutions(
 
         # Format for display
         if table_format:
-            display_solutions = []
-            for solution in solutions:
-                props = solution.get("properties", {})
-                display_solutions.append({
-                    "displayName": props.get("displayName", ""),
-                    "uniqueName": props.get("uniqueName", ""),
-                    "id": solution.get("name", ""),
-                    "version": props.get("version", ""),
-                    "publisher": props.get("publisherName", ""),
-                })
-            format_response(display_solutions, ctx, columns=["displayName", "uniqueName", "id", "version", "publisher"])
+            display_solutions = (_solution_row(solution) for solution in solutions)
+            format_response(display_solutions, ctx, columns=_SOLUTION_COLUMNS)
         else:
             format_response(solutions, ctx)
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 @app.command("get")
 def get_solution(
     ctx: typer.Context,
-    solution_id: str = typer.Argument(..., help="Solution ID or unique name"),
-    by_name: bool = typer.Option(False, "--name", help="Treat argument as solution unique name"),
+    solution_id: str = _SOLUTION_ARGUMENT,
+    by_name: bool = _BY_NAME_OPTION,
 ):
     """
     Get detailed information about a specific solution.
@@ -81,8 +127,8 @@ def get_solution(
         powerautomate solution get <solution-id>
         powerautomate solution get ProgressContentAutomation --name
     """
-    try:
-        client = get_client()
+    with api_errors():
+        client = _client()
 
         if by_name:
             # Resolve solution name to ID
@@ -91,17 +137,13 @@ def get_solution(
         result = client.get_solution(solution_id)
         format_response(result, ctx)
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 @app.command("components")
 def list_components(
     ctx: typer.Context,
-    solution_id: str = typer.Argument(..., help="Solution ID or unique name"),
-    by_name: bool = typer.Option(False, "--name", help="Treat argument as solution unique name"),
-    table_format: bool = typer.Option(False, "--table", "-t", help="Display as table"),
+    solution_id: str = _SOLUTION_ARGUMENT,
+    by_name: bool = _BY_NAME_OPTION,
+    table_format: bool = _TABLE_OPTION,
     component_type: Optional[str] = typer.Option(None, "--type", help="Filter by component type (e.g., 'Workflow')"),
 ):
     """
@@ -112,8 +154,8 @@ def list_components(
         powerautomate solution components ProgressContentAutomation --name --table
         powerautomate solution components <solution-id> --type Workflow
     """
-    try:
-        client = get_client()
+    with api_errors():
+        client = _client()
 
         if by_name:
             # Resolve solution name to ID
@@ -130,30 +172,18 @@ def list_components(
 
         # Format for display
         if table_format:
-            display_components = []
-            for component in components:
-                props = component.get("properties", {})
-                display_components.append({
-                    "displayName": props.get("displayName", ""),
-                    "type": component.get("type", ""),
-                    "id": component.get("name", ""),
-                    "createdTime": props.get("createdTime", ""),
-                })
-            format_response(display_components, ctx, columns=["displayName", "type", "id", "createdTime"])
+            display_components = (_component_row(component) for component in components)
+            format_response(display_components, ctx, columns=_COMPONENT_COLUMNS)
         else:
             format_response(components, ctx)
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 @app.command("flows")
 def list_solution_flows(
     ctx: typer.Context,
-    solution_id: str = typer.Argument(..., help="Solution ID or unique name"),
-    by_name: bool = typer.Option(False, "--name", help="Treat argument as solution unique name"),
-    table_format: bool = typer.Option(False, "--table", "-t", help="Display as table"),
+    solution_id: str = _SOLUTION_ARGUMENT,
+    by_name: bool = _BY_NAME_OPTION,
+    table_format: bool = _TABLE_OPTION,
 ):
     """
     List all flows in a solution.
@@ -162,8 +192,8 @@ def list_solution_flows(
         powerautomate solution flows <solution-id>
         powerautomate solution flows ProgressContentAutomation --name --table
     """
-    try:
-        client = get_client()
+    with api_errors():
+        client = _client()
 
         if by_name:
             # Resolve solution name to ID
@@ -181,19 +211,7 @@ def list_solution_flows(
 
         # Format for display
         if table_format:
-            display_flows = []
-            for flow in flows:
-                props = flow.get("properties", {})
-                display_flows.append({
-                    "displayName": props.get("displayName", ""),
-                    "id": flow.get("name", ""),
-                    "state": props.get("state", ""),
-                    "createdTime": props.get("createdTime", ""),
-                })
-            format_response(display_flows, ctx, columns=["displayName", "id", "state", "createdTime"])
+            display_flows = (_solution_flow_row(flow) for flow in flows)
+            format_response(display_flows, ctx, columns=_SOLUTION_FLOW_COLUMNS)
         else:
             format_response(flows, ctx)
-
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
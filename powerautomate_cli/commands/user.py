@@ -1,18 +1,97 @@
 """Power Platform user management commands."""
+import hashlib
+import re
+import uuid
 import typer
-from typing import Optional
-from ..client import get_client
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from ..output import (
     format_response,
     print_success,
     print_error,
     print_info,
-    handle_api_error,
+    api_errors,
+    loads_json,
+    ClientError,
 )
+from ..cache import load_json_cache, save_json_cache
 from ..config import get_config
 
+if TYPE_CHECKING:
+    import requests
+
 app = typer.Typer(help="Manage Power Platform users and application users")
 
+# GUID key of the entity URL in an OData-EntityId header
+_ENTITY_ID_RE = re.compile(r"\(([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})\)")
+
+# Ask Dataverse to leave instance annotations (formatted values, etc.) out of responses
+_NO_ANNOTATIONS = 'odata.include-annotations="none"'
+
+# How long resolved security role IDs are cached on disk (1 day)
+_ROLE_CACHE_TTL = 24 * 60 * 60
+
+# Shared HTTP session for Dataverse and Microsoft Graph requests
+_session: Optional["requests.Session"] = None
+
+
+def _client():
+    """
+    Return the shared Power Automate API client.
+
+    Imported lazily so that registering the user commands at startup does
+    not pull in requests and msal.
+    """
+    from ..client import get_client
+
+    return get_client()
+
+
+@lru_cache(maxsize=8)
+def _request_headers(access_token: str, prefer: Optional[str] = None) -> Dict[str, str]:
+    """
+    Build the per-request headers once per token and preference.
+
+    The OData headers live on the shared session; this adds authorization
+    and an optional Prefer header. The returned dict is shared and must not
+    be modified.
+
+    Args:
+        access_token: OAuth access token
+        prefer: Optional Prefer header value
+
+    Returns:
+        Request headers
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    if prefer:
+        headers["Prefer"] = prefer
+    return headers
+
+
+def _get_session() -> "requests.Session":
+    """
+    Get or create the shared HTTP session.
+
+    Reusing one keep-alive session lets the role lookup and assignment
+    requests share TLS connections instead of opening one per call.
+
+    Returns:
+        requests.Session: Session with the OData request headers set
+    """
+    global _session
+    if _session is None:
+        from ..client import _create_session
+
+        _session = _create_session()
+        _session.headers.update({
+            "Accept": "application/json",
+            "OData-MaxVersion": "4.0",
+            "OData-Version": "4.0",
+        })
+    return _session
+
 
 @app.command("create-app-user")
 def create_app_user(
@@ -35,9 +114,9 @@ def create_app_user(
         powerautomate user create-app-user 4f604d1b-7b0b-4cbf-bee7-c0402bce975d
         powerautomate user create-app-user <app-id> --roles "System Administrator,Environment Maker"
     """
-    try:
+    with api_errors():
         config = get_config()
-        client = get_client()
+        client = _client()
 
         # Get Dataverse URL from config
         dataverse_url = config.dataverse_url
@@ -45,62 +124,44 @@ def create_app_user(
             print_error("DATAVERSE_URL not found in configuration")
             raise typer.Exit(1)
 
-        # Get access token for Dataverse
-        import requests
-
         # Build Dataverse API endpoint
         api_url = f"{dataverse_url}/api/data/v9.2"
 
-        # First, check if application user already exists
+        # Look up an existing application user (by its Azure AD object ID
+        # alternate key) and the Azure AD app details concurrently; the two
+        # requests are independent and both only need the app ID.
         print_info(f"Checking for existing application user with app ID: {app_id}")
-
-        check_response = requests.get(
-            f"{api_url}/systemusers",
-            headers={
-                "Authorization": f"Bearer {client.access_token}",
-                "Accept": "application/json",
-                "OData-MaxVersion": "4.0",
-                "OData-Version": "4.0",
-            },
-            params={
-                "$filter": f"azureactivedirectoryobjectid eq {app_id}",
-                "$select": "systemuserid,fullname,applicationid,isdisabled"
-            }
-        )
-
-        if check_response.status_code == 200:
-            existing = check_response.json().get("value", [])
-            if existing:
-                user_id = existing[0].get("systemuserid")
-                print_warning(f"Application user already exists with ID: {user_id}")
-                format_response(existing[0], ctx)
-
-                # Assign roles to existing user
-                if roles:
-                    print_info(f"Assigning roles to existing user: {roles}")
-                    assign_roles_to_user(api_url, client.access_token, user_id, roles)
-
-                return
-
-        # Get Azure AD app details using Microsoft Graph
         print_info(f"Fetching application details from Azure AD...")
 
-        graph_response = requests.get(
-            f"https://graph.microsoft.com/v1.0/applications",
-            headers={
-                "Authorization": f"Bearer {client.access_token}",
-                "Accept": "application/json",
-            },
-            params={
-                "$filter": f"appId eq '{app_id}'"
-            }
-        )
+        user_url = f"{api_url}/systemusers(azureactivedirectoryobjectid={app_id})"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            check_future = executor.submit(
+                _get_session().get,
+                user_url,
+                headers=_request_headers(client.access_token, _NO_ANNOTATIONS),
+                params={"$select": "systemuserid,fullname,applicationid,isdisabled"}
+            )
+            graph_future = executor.submit(
+                _get_session().get,
+                f"https://graph.microsoft.com/v1.0/applications",
+                headers=_request_headers(client.access_token),
+                params={"$filter": f"appId eq '{app_id}'"}
+            )
+            check_response = check_future.result()
+
+        # An existing user does not need the Graph lookup, so its outcome
+        # (including a connection error) is only looked at after this
+        if check_response.status_code == 200:
+            _use_existing_app_user(ctx, api_url, client.access_token, loads_json(check_response.content), roles)
+            return
 
+        graph_response = graph_future.result()
         if graph_response.status_code != 200:
             print_error(f"Failed to fetch app from Azure AD: {graph_response.text}")
             raise typer.Exit(1)
 
-        apps = graph_response.json().get("value", [])
+        apps = loads_json(graph_response.content).get("value", [])
         if not apps:
             print_error(f"Application not found in Azure AD: {app_id}")
             raise typer.Exit(1)
@@ -110,7 +171,8 @@ def create_app_user(
 
         print_info(f"Found application: {app_name}")
 
-        # Create application user in Dataverse
+        # Create application user in Dataverse. If-None-Match: * makes the
+        # upsert create-only, so a user created since the check is not modified.
         print_info("Creating application user in Dataverse...")
 
         user_data = {
@@ -120,18 +182,24 @@ def create_app_user(
             "isdisabled": False,
         }
 
-        create_response = requests.post(
-            f"{api_url}/systemusers",
-            headers={
-                "Authorization": f"Bearer {client.access_token}",
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-                "OData-MaxVersion": "4.0",
-                "OData-Version": "4.0",
-            },
+        create_response = _get_session().patch(
+            user_url,
+            headers={**_request_headers(client.access_token), "If-None-Match": "*"},
             json=user_data
         )
 
+        if create_response.status_code == 412:
+            # Precondition failed: the user was created since the check
+            existing = _get_session().get(
+                user_url,
+                headers=_request_headers(client.access_token, _NO_ANNOTATIONS),
+                params={"$select": "systemuserid,fullname,applicationid,isdisabled"}
+            )
+            if existing.status_code != 200:
+                raise ClientError(f"HTTP {existing.status_code}: {existing.text}")
+            _use_existing_app_user(ctx, api_url, client.access_token, loads_json(existing.content), roles)
+            return
+
         if create_response.status_code not in [201, 204]:
             print_error(f"Failed to create application user: {create_response.text}")
             raise typer.Exit(1)
@@ -141,8 +209,7 @@ def create_app_user(
         if "OData-EntityId" in create_response.headers:
             entity_id = create_response.headers["OData-EntityId"]
             # Extract GUID from URL
-            import re
-            match = re.search(r'\(([a-f0-9-]+)\)', entity_id)
+            match = _ENTITY_ID_RE.search(entity_id)
             if match:
                 user_id = match.group(1)
 
@@ -159,66 +226,184 @@ def create_app_user(
 
         print_success("Application user setup complete!")
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
-def assign_roles_to_user(api_url: str, access_token: str, user_id: str, role_names: str):
-    """Assign security roles to a user."""
-    import requests
+def _use_existing_app_user(ctx: typer.Context, api_url: str, access_token: str,
+                           user: dict, roles: Optional[str]):
+    """
+    Report an application user that already exists and assign it roles.
+
+    Args:
+        ctx: Typer context
+        api_url: Dataverse Web API base URL
+        access_token: OAuth access token
+        user: Existing system user record
+        roles: Comma-separated role names to assign, if any
+    """
+    user_id = user.get("systemuserid")
+    print_warning(f"Application user already exists with ID: {user_id}")
+    format_response(user, ctx)
 
-    role_list = [r.strip() for r in role_names.split(",")]
+    # Assign roles to existing user
+    if roles:
+        print_info(f"Assigning roles to existing user: {roles}")
+        assign_roles_to_user(api_url, access_token, user_id, roles)
 
-    for role_name in role_list:
-        # Find role by name
-        role_response = requests.get(
-            f"{api_url}/roles",
-            headers={
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/json",
-                "OData-MaxVersion": "4.0",
-                "OData-Version": "4.0",
-            },
-            params={
-                "$filter": f"name eq '{role_name}'",
-                "$select": "roleid,name"
-            }
-        )
 
-        if role_response.status_code != 200:
-            print_error(f"Failed to find role '{role_name}': {role_response.text}")
+def _find_roles(api_url: str, access_token: str, role_names: List[str],
+                role_ids: Dict[str, str], messages: Dict[str, list]):
+    """
+    Look up security roles by name in a single query.
+
+    Args:
+        api_url: Dataverse Web API base URL
+        access_token: OAuth access token
+        role_names: Role names to look up
+        role_ids: Mapping of role name to role ID, updated with found roles
+        messages: Per-role list of (print function, message) pairs, appended to
+    """
+    if not role_names:
+        return
+
+    # OData string literals escape a single quote by doubling it
+    quoted_names = [name.replace("'", "''") for name in role_names]
+    name_filter = " or ".join(f"name eq '{name}'" for name in quoted_names)
+    role_response = _get_session().get(
+        f"{api_url}/roles",
+        headers=_request_headers(access_token, _NO_ANNOTATIONS),
+        params={
+            "$filter": name_filter,
+            "$select": "roleid,name",
+        }
+    )
+
+    if role_response.status_code != 200:
+        for role_name in role_names:
+            messages[role_name].append((print_error, f"Failed to find role '{role_name}': {role_response.text}"))
+        return
+
+    # A role exists once per business unit; the first match is used. Dataverse
+    # compares names case-insensitively, so match them the same way.
+    found = {}
+    for role in loads_json(role_response.content).get("value", []):
+        found.setdefault((role.get("name") or "").lower(), role.get("roleid"))
+
+    for role_name in role_names:
+        role_id = found.get(role_name.lower())
+        if not role_id:
+            messages[role_name].append((print_error, f"Role not found: {role_name}"))
             continue
+        role_ids[role_name] = role_id
+        messages[role_name].append((print_info, f"Found role '{role_name}' with ID: {role_id}"))
 
-        roles = role_response.json().get("value", [])
-        if not roles:
-            print_error(f"Role not found: {role_name}")
-            continue
 
-        role_id = roles[0].get("roleid")
-        print_info(f"Found role '{role_name}' with ID: {role_id}")
-
-        # Assign role to user
-        assign_response = requests.post(
-            f"{api_url}/systemusers({user_id})/systemuserroles_association/$ref",
-            headers={
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-                "OData-MaxVersion": "4.0",
-                "OData-Version": "4.0",
-            },
-            json={
-                "@odata.id": f"{api_url}/roles({role_id})"
-            }
+def _associate_roles(api_url: str, access_token: str, user_id: str,
+                     role_ids: List[str]) -> List[Tuple[int, str]]:
+    """
+    Associate security roles with a user in a single $batch request.
+
+    The operations are sent outside a change set with
+    odata.continue-on-error, so one failure (e.g. a role that is already
+    assigned) does not roll back the others.
+
+    Args:
+        api_url: Dataverse Web API base URL
+        access_token: OAuth access token
+        user_id: System user ID
+        role_ids: Role IDs to associate
+
+    Returns:
+        List of (status code, response body) per role, in the same order
+
+    Raises:
+        ClientError: If the $batch request itself fails
+    """
+    from ..dataverse_client import parse_batch_response
+
+    boundary = f"batch_{uuid.uuid4()}"
+    parts = []
+    for role_id in role_ids:
+        parts.append(
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            "Content-Transfer-Encoding: binary\r\n\r\n"
+            f"POST {api_url}/systemusers({user_id})/systemuserroles_association/$ref HTTP/1.1\r\n"
+            "Content-Type: application/json\r\n\r\n"
+            f'{{"@odata.id": "{api_url}/roles({role_id})"}}\r\n'
         )
+    body = "".join(parts) + f"--{boundary}--\r\n"
+
+    response = _get_session().post(
+        f"{api_url}/$batch",
+        data=body.encode("utf-8"),
+        headers={
+            **_request_headers(access_token),
+            "Content-Type": f"multipart/mixed; boundary={boundary}",
+            "Prefer": "odata.continue-on-error",
+        },
+    )
+    if response.status_code != 200:
+        raise ClientError(f"HTTP {response.status_code}: {response.text}")
+
+    results = [(status, payload.decode("utf-8", "replace")) for status, _, payload in parse_batch_response(response)]
+    if len(results) != len(role_ids):
+        raise ClientError(f"Batch returned {len(results)} responses for {len(role_ids)} role assignments")
+    return results
+
+
+def assign_roles_to_user(api_url: str, access_token: str, user_id: str, role_names: str):
+    """
+    Assign security roles to a user.
+
+    Role IDs are cached on disk per Dataverse environment; roles that are not
+    cached are looked up in one query. All associations are then sent in one
+    $batch request. A cached role that no longer exists is looked up again.
+    """
+    role_list = list(dict.fromkeys(r.strip() for r in role_names.split(",")))
 
-        if assign_response.status_code in [200, 204]:
+    cache_name = f"roles_{hashlib.sha1(api_url.encode('utf-8')).hexdigest()[:16]}"
+    cached_ids = load_json_cache(cache_name, _ROLE_CACHE_TTL) or {}
+
+    messages = {role_name: [] for role_name in role_list}
+    role_ids = {}
+    for role_name in role_list:
+        if role_name in cached_ids:
+            role_ids[role_name] = cached_ids[role_name]
+            messages[role_name].append((print_info, f"Using cached role '{role_name}' with ID: {cached_ids[role_name]}"))
+
+    _find_roles(api_url, access_token, [r for r in role_list if r not in role_ids], role_ids, messages)
+
+    names = [r for r in role_list if r in role_ids]
+    outcomes = {}
+    if names:
+        outcomes.update(zip(names, _associate_roles(api_url, access_token, user_id, [role_ids[r] for r in names])))
+
+    # Cached roles that were deleted since: look them up again and retry
+    stale = [r for r in names if outcomes[r][0] == 404 and r in cached_ids]
+    if stale:
+        for role_name in stale:
+            del role_ids[role_name]
+            del outcomes[role_name]
+        _find_roles(api_url, access_token, stale, role_ids, messages)
+        retry = [r for r in stale if r in role_ids]
+        if retry:
+            outcomes.update(zip(retry, _associate_roles(api_url, access_token, user_id, [role_ids[r] for r in retry])))
+
+    for role_name in role_list:
+        for print_message, message in messages[role_name]:
+            print_message(message)
+        if role_name not in outcomes:
+            continue
+        status, text = outcomes[role_name]
+        if status in [200, 204]:
             print_success(f"✓ Assigned role: {role_name}")
-        elif assign_response.status_code == 400 and "duplicate" in assign_response.text.lower():
+        elif status == 400 and "duplicate" in text.lower():
             print_info(f"  Role '{role_name}' already assigned")
         else:
-            print_error(f"Failed to assign role '{role_name}': {assign_response.text}")
+            print_error(f"Failed to assign role '{role_name}': {text}")
+
+    updated_ids = {**{r: i for r, i in cached_ids.items() if r not in stale}, **role_ids}
+    if updated_ids != cached_ids:
+        save_json_cache(cache_name, updated_ids)
 
 
 @app.command("list-app-users")
@@ -236,9 +421,9 @@ def list_app_users(
         powerautomate user list-app-users
         powerautomate user list-app-users --table
     """
-    try:
+    with api_errors():
         config = get_config()
-        client = get_client()
+        client = _client()
 
         dataverse_url = config.dataverse_url
         if not dataverse_url:
@@ -247,16 +432,9 @@ def list_app_users(
 
         api_url = f"{dataverse_url}/api/data/v9.2"
 
-        import requests
-
-        response = requests.get(
+        response = _get_session().get(
             f"{api_url}/systemusers",
-            headers={
-                "Authorization": f"Bearer {client.access_token}",
-                "Accept": "application/json",
-                "OData-MaxVersion": "4.0",
-                "OData-Version": "4.0",
-            },
+            headers=_request_headers(client.access_token, _NO_ANNOTATIONS),
             params={
                 "$filter": "applicationid ne null",
                 "$select": "systemuserid,fullname,applicationid,isdisabled,azureactivedirectoryobjectid"
@@ -267,7 +445,7 @@ def list_app_users(
             print_error(f"Failed to list application users: {response.text}")
             raise typer.Exit(1)
 
-        users = response.json().get("value", [])
+        users = loads_json(response.content).get("value", [])
 
         if not users:
             print_error("No application users found")
@@ -286,10 +464,6 @@ def list_app_users(
         else:
             format_response(users, ctx)
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
-
 
 @app.command("assign-role")
 def assign_role_to_user(
@@ -304,9 +478,9 @@ def assign_role_to_user(
         powerautomate user assign-role adam@example.com "System Administrator"
         powerautomate user assign-role user@domain.com "Environment Maker"
     """
-    try:
+    with api_errors():
         config = get_config()
-        client = get_client()
+        client = _client()
 
         dataverse_url = config.dataverse_url
         if not dataverse_url:
@@ -315,22 +489,16 @@ def assign_role_to_user(
 
         api_url = f"{dataverse_url}/api/data/v9.2"
 
-        import requests
-
         # Find user by email
         print_info(f"Looking up user: {email}")
 
-        user_response = requests.get(
+        user_response = _get_session().get(
             f"{api_url}/systemusers",
-            headers={
-                "Authorization": f"Bearer {client.access_token}",
-                "Accept": "application/json",
-                "OData-MaxVersion": "4.0",
-                "OData-Version": "4.0",
-            },
+            headers=_request_headers(client.access_token, _NO_ANNOTATIONS),
             params={
                 "$filter": f"internalemailaddress eq '{email}'",
-                "$select": "systemuserid,fullname,internalemailaddress"
+                "$select": "systemuserid,fullname,internalemailaddress",
+                "$top": 1,
             }
         )
 
@@ -338,7 +506,7 @@ def assign_role_to_user(
             print_error(f"Failed to find user: {user_response.text}")
             raise typer.Exit(1)
 
-        users = user_response.json().get("value", [])
+        users = loads_json(user_response.content).get("value", [])
         if not users:
             print_error(f"User not found: {email}")
             raise typer.Exit(1)
@@ -355,11 +523,11 @@ def assign_role_to_user(
 
         print_success(f"Successfully assigned '{role}' to {user_name}!")
 
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+
+# Styled once at import; typer.echo strips the colour codes when not writing to a terminal
+_WARNING_TEMPLATE = typer.style("⚠ {}", fg=typer.colors.YELLOW)
 
 
 def print_warning(message: str):
     """Print a warning message."""
-    typer.echo(typer.style(f"⚠ {message}", fg=typer.colors.YELLOW))
+    typer.echo(_WARNING_TEMPLATE.format(message))
@@ -2,46 +2,141 @@
 import os
 from pathlib import Path
 from typing import Optional, List
-from dotenv import load_dotenv
+from functools import cached_property
+
+
+# Set once the .env files have been loaded into the environment
+_env_loaded = False
+
+
+def _config_dir() -> Path:
+    """Return the per-user configuration directory, honouring XDG_CONFIG_HOME."""
+    base = os.getenv("XDG_CONFIG_HOME")
+    return (Path(base) if base else Path.home() / ".config") / "powerautomate-cli"
+
+
+def _find_env_file() -> Optional[Path]:
+    """
+    Locate the shared dataverse-cli .env file.
+
+    Order: the POWERAUTOMATE_ENV_FILE override, the path remembered from a
+    previous run, then a search of the usual locations. A file found by the
+    search is remembered so later runs skip the probes.
+
+    Returns:
+        Path to the .env file, or None if none was found
+    """
+    override = os.getenv("POWERAUTOMATE_ENV_FILE")
+    if override:
+        return Path(override).expanduser()
+
+    remembered = _config_dir() / "envpath"
+    try:
+        path = Path(remembered.read_text(encoding="utf-8").strip())
+        if path.is_file():
+            return path
+    except OSError:
+        pass
+
+    # Try relative path first (sibling directory), then common locations
+    current_file = Path(__file__).resolve()
+    possible_paths = [
+        current_file.parent.parent.parent / "Microsoft-Dataverse-CLI" / ".env",
+        _config_dir() / ".env",
+        Path.home() / "Dropbox" / "GitRepos" / "Microsoft-Dataverse-CLI" / ".env",
+        Path.home() / "GitRepos" / "Microsoft-Dataverse-CLI" / ".env",
+        Path.home() / "repos" / "Microsoft-Dataverse-CLI" / ".env",
+    ]
+    for path in possible_paths:
+        if path.is_file():
+            try:
+                remembered.parent.mkdir(parents=True, exist_ok=True)
+                remembered.write_text(str(path), encoding="utf-8")
+            except OSError:
+                pass
+            return path
+    return None
+
+
+def _load_env_once():
+    """
+    Load the shared and local .env files into the environment.
+
+    Runs at most once per process and only when a setting is first read,
+    so commands that never need credentials (e.g. --help) skip the
+    filesystem probes and the dotenv import entirely.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+
+    from dotenv import load_dotenv
+
+    # Load from dataverse-cli .env file (shared config)
+    env_file = _find_env_file()
+    if env_file:
+        load_dotenv(env_file)
+
+    # Also check local .env
+    load_dotenv()
+
+
+def _getenv(*names: str) -> str:
+    """
+    Read the first non-empty environment variable out of several names.
+
+    Args:
+        names: Variable names in order of preference
+
+    Returns:
+        Variable value, or an empty string if none is set
+    """
+    _load_env_once()
+    for name in names:
+        value = os.getenv(name)
+        if value:
+            return value
+    return ""
 
 
 class Config:
-    """Configuration for Power Automate API client."""
-
-    def __init__(self):
-        """Initialize configuration from environment variables."""
-        # Load from dataverse-cli .env file (shared config)
-        # Try relative path first (sibling directory)
-        current_file = Path(__file__).resolve()
-        dataverse_cli_path = current_file.parent.parent.parent / "Microsoft-Dataverse-CLI" / ".env"
-
-        if dataverse_cli_path.exists():
-            load_dotenv(dataverse_cli_path)
-        else:
-            # Fallback: try to find in common locations
-            possible_paths = [
-                Path.home() / "Dropbox" / "GitRepos" / "Microsoft-Dataverse-CLI" / ".env",
-                Path.home() / "GitRepos" / "Microsoft-Dataverse-CLI" / ".env",
-                Path.home() / "repos" / "Microsoft-Dataverse-CLI" / ".env",
-            ]
-            for path in possible_paths:
-                if path.exists():
-                    load_dotenv(path)
-                    break
-
-        # Also check local .env
-        load_dotenv()
-
-        # Power Automate API (delegated authentication)
-        self.client_id = os.getenv("DATAVERSE_CLIENT_ID", "")
-        self.tenant_id = os.getenv("DATAVERSE_TENANT_ID", "")
-        self.environment_id = os.getenv("DATAVERSE_ENVIRONMENT_ID") or os.getenv("POWERAUTOMATE_ENVIRONMENT_ID", "")
-        self.dataverse_url = os.getenv("DATAVERSE_URL", "")
-
-        # Dataverse API (service principal or user authentication)
-        self.client_secret = os.getenv("DATAVERSE_CLIENT_SECRET", "")
-        self.username = os.getenv("DATAVERSE_USERNAME", "")
-        self.password = os.getenv("DATAVERSE_PASSWORD", "")
+    """
+    Configuration for Power Automate API client.
+
+    Settings are read from environment variables (and .env files) lazily,
+    on first access, and then cached on the instance.
+    """
+
+    # Power Automate API (delegated authentication)
+    @cached_property
+    def client_id(self) -> str:
+        return _getenv("DATAVERSE_CLIENT_ID")
+
+    @cached_property
+    def tenant_id(self) -> str:
+        return _getenv("DATAVERSE_TENANT_ID")
+
+    @cached_property
+    def environment_id(self) -> str:
+        return _getenv("DATAVERSE_ENVIRONMENT_ID", "POWERAUTOMATE_ENVIRONMENT_ID")
+
+    @cached_property
+    def dataverse_url(self) -> str:
+        return _getenv("DATAVERSE_URL")
+
+    # Dataverse API (service principal or user authentication)
+    @cached_property
+    def client_secret(self) -> str:
+        return _getenv("DATAVERSE_CLIENT_SECRET")
+
+    @cached_property
+    def username(self) -> str:
+        return _getenv("DATAVERSE_USERNAME")
+
+    @cached_property
+    def password(self) -> str:
+        return _getenv("DATAVERSE_PASSWORD")
 
     def get_missing_credentials(self) -> List[str]:
         """
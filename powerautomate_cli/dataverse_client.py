@@ -1,14 +1,26 @@
 """Dataverse Web API client for Power Automate CLI."""
+import uuid
 import requests
-from typing import Optional, Dict, Any
+from email.parser import BytesParser
+from typing import Optional, Dict, Any, Generator, List, Tuple
 from msal import ConfidentialClientApplication, PublicClientApplication
 from .config import get_config
-from .output import ClientError
+from .output import ClientError, dumps_json, loads_json
 
 
 # Global Dataverse client instance
 _dataverse_client: Optional['DataverseClient'] = None
 
+# Maximum number of operations Dataverse accepts in one $batch request
+_BATCH_LIMIT = 100
+
+# Concurrent GET requests issued by get_many()
+_MAX_WORKERS = 8
+
+# Per-request headers for write operations; the session headers stay untouched
+_PATCH_HEADERS = {"Content-Type": "application/json"}
+_POST_HEADERS = {**_PATCH_HEADERS, "Prefer": "return=representation"}
+
 
 class DataverseClient:
     """
@@ -33,10 +45,14 @@ class DataverseClient:
             dataverse_url: Base URL for Dataverse environment (e.g., https://org.crm.dynamics.com)
             access_token: OAuth access token for authentication
         """
+        # client.py re-exports this module, so import lazily to avoid a cycle
+        from .client import _create_session
+
         self.dataverse_url = dataverse_url.rstrip('/')
         self.access_token = access_token
         self.api_base = f"{self.dataverse_url}/api/data/v9.2"
-        self.session = requests.Session()
+        # Share the pooled, retrying session setup with the Management API client
+        self.session = _create_session()
         self.session.headers.update({
             "Authorization": f"Bearer {self.access_token}",
             "Accept": "application/json",
@@ -49,7 +65,8 @@ class DataverseClient:
         Make a GET request to the Dataverse API.
 
         Args:
-            endpoint: API endpoint (e.g., 'workflows', 'solutions', 'asyncoperations')
+            endpoint: API endpoint (e.g., 'workflows', 'solutions', 'asyncoperations'),
+                or an absolute URL such as an @odata.nextLink
             params: Optional query parameters (OData filters, select, expand, etc.)
 
         Returns:
@@ -68,11 +85,15 @@ class DataverseClient:
             # Get workflow with expanded properties
             client.get('workflows', {'$select': 'name,statecode', '$expand': 'ownerid'})
         """
-        url = f"{self.api_base}/{endpoint}"
+        # Absolute URLs (e.g. @odata.nextLink) are used as-is
+        if not endpoint.startswith(('http://', 'https://')):
+            url = f"{self.api_base}/{endpoint}"
+        else:
+            url = endpoint
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return loads_json(response.content) if response.content else {}
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -93,11 +114,9 @@ class DataverseClient:
             ClientError: If the request fails
         """
         url = f"{self.api_base}/{endpoint}"
-        self.session.headers["Content-Type"] = "application/json"
-        self.session.headers["Prefer"] = "return=representation"
 
         try:
-            response = self.session.post(url, json=data)
+            response = self.session.post(url, data=dumps_json(data, indent=None), headers=_POST_HEADERS)
             response.raise_for_status()
 
             # Handle 204 No Content responses
@@ -109,7 +128,7 @@ class DataverseClient:
                     return {"id": entity_id}
                 return {}
 
-            return response.json() if response.text else {}
+            return loads_json(response.content) if response.content else {}
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -130,12 +149,11 @@ class DataverseClient:
             ClientError: If the request fails
         """
         url = f"{self.api_base}/{endpoint}"
-        self.session.headers["Content-Type"] = "application/json"
 
         try:
-            response = self.session.patch(url, json=data)
+            response = self.session.patch(url, data=dumps_json(data, indent=None), headers=_PATCH_HEADERS)
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return loads_json(response.content) if response.content else {}
         except requests.exceptions.HTTPError as e:
             raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
         except requests.exceptions.RequestException as e:
@@ -161,13 +179,185 @@ class DataverseClient:
         except requests.exceptions.RequestException as e:
             raise ClientError(f"Request failed: {e}")
 
+    def iter_pages(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                   limit: Optional[int] = None) -> Generator[Dict[str, Any], None, bool]:
+        """
+        Iterate over the records of a paged collection, following @odata.nextLink.
+
+        The next page is requested on a background thread while the records
+        of the current page are being consumed, so fetching overlaps processing.
+
+        Args:
+            endpoint: API endpoint (e.g., 'workflows')
+            params: Optional query parameters for the first request
+            limit: Optional maximum number of records to yield
+
+        Yields:
+            Records from the 'value' array of each page
+
+        Returns:
+            True if the collection has more records than were yielded
+
+        Raises:
+            ClientError: If a request fails
+        """
+        from .client import _iter_pages
+
+        return (yield from _iter_pages(self.get, endpoint, params, limit, ("@odata.nextLink",)))
+
+    def get_many(
+        self,
+        queries: List[Tuple[str, Optional[Dict[str, Any]]]],
+        max_workers: int = _MAX_WORKERS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Make several GET requests concurrently.
+
+        The calls are network-bound, so they are fanned out over a small
+        thread pool sharing this client's session instead of being awaited
+        one after another.
+
+        Args:
+            queries: (endpoint, params) pairs, as accepted by get()
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            JSON responses, in the same order as queries
+
+        Raises:
+            ClientError: If any of the requests fails
+        """
+        if len(queries) <= 1:
+            return [self.get(endpoint, params) for endpoint, params in queries]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            return list(executor.map(lambda query: self.get(*query), queries))
+
+    def batch(self, operations: List[Tuple[str, str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """
+        Execute several requests in one round trip using the OData $batch endpoint.
+
+        Operations are packed into multipart/mixed batches of at most 100
+        and sent as independent top-level requests (no change set), so they
+        run in order but are not rolled back together.
+
+        Args:
+            operations: (method, endpoint, body) tuples; endpoint may include a
+                query string and body is the JSON payload for POST/PATCH, or None
+
+        Returns:
+            Parsed JSON response bodies, in the same order as operations;
+            empty dictionaries for operations without a response body
+
+        Raises:
+            ClientError: If the batch request or any operation in it fails
+
+        Examples:
+            client.batch([
+                ('GET', 'workflows(<id>)?$select=name', None),
+                ('PATCH', 'workflows(<id>)', {'description': 'Updated'}),
+            ])
+        """
+        results = []
+        for start in range(0, len(operations), _BATCH_LIMIT):
+            results.extend(self._send_batch(operations[start:start + _BATCH_LIMIT]))
+        return results
+
+    def batch_get(self, endpoints: List[str]) -> List[Dict[str, Any]]:
+        """
+        Execute several GET requests in one round trip using the OData $batch endpoint.
+
+        Args:
+            endpoints: API endpoints including any query string
+                (e.g., 'workflows?$select=workflowid&$filter=...')
+
+        Returns:
+            Parsed JSON response bodies, in the same order as endpoints
+
+        Raises:
+            ClientError: If the batch request or any operation in it fails
+        """
+        return self.batch([("GET", endpoint, None) for endpoint in endpoints])
+
+    def _send_batch(self, operations: List[Tuple[str, str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """Send one $batch request and parse its responses."""
+        boundary = f"batch_{uuid.uuid4()}"
+        parts = []
+        for method, endpoint, data in operations:
+            head = (
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                "Content-Transfer-Encoding: binary\r\n\r\n"
+                f"{method} {self.api_base}/{endpoint} HTTP/1.1\r\n"
+                "Accept: application/json\r\n"
+            )
+            if data is None:
+                parts.append(f"{head}\r\n".encode("utf-8"))
+            else:
+                parts.append(f"{head}Content-Type: application/json\r\n\r\n".encode("utf-8"))
+                parts.append(dumps_json(data, indent=None) + b"\r\n")
+        parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+
+        try:
+            response = self.session.post(
+                f"{self.api_base}/$batch",
+                data=b"".join(parts),
+                headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+            )
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            raise ClientError(f"HTTP {e.response.status_code}: {e.response.text}")
+        except requests.exceptions.RequestException as e:
+            raise ClientError(f"Request failed: {e}")
+
+        results = []
+        for status, status_line, payload in parse_batch_response(response):
+            if not 200 <= status < 300:
+                raise ClientError(f"Batch operation failed: {status_line}: {payload.decode('utf-8', 'replace')}")
+            results.append(loads_json(payload) if payload.strip() else {})
+
+        if len(results) != len(operations):
+            raise ClientError(f"Batch returned {len(results)} responses for {len(operations)} requests")
+        return results
+
+
+def parse_batch_response(response: requests.Response) -> List[Tuple[int, str, bytes]]:
+    """
+    Split a multipart/mixed $batch response into its operation responses.
+
+    Each part wraps a raw HTTP response. Change set parts are not expanded,
+    so batches are expected to contain only top-level operations.
+
+    Args:
+        response: Response to a $batch request
+
+    Returns:
+        List of (status code, status line, body) tuples in request order;
+        the status code is 0 if the status line cannot be parsed
+    """
+    content_type = response.headers.get("Content-Type", "")
+    message = BytesParser().parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + response.content
+    )
+    results = []
+    for part in message.get_payload():
+        head, _, payload = part.get_payload(decode=True).partition(b"\r\n\r\n")
+        status_line = head.split(b"\r\n", 1)[0].decode("utf-8", "replace")
+        status = status_line.split(" ", 2)
+        code = int(status[1]) if len(status) > 1 and status[1].isdigit() else 0
+        results.append((code, status_line, payload))
+    return results
+
 
 def _get_service_principal_token(config) -> str:
     """
     Get access token using service principal (client credentials flow).
 
     This is the recommended authentication method for accessing Dataverse
-    in automated scenarios.
+    in automated scenarios. Tokens are kept in the CLI's on-disk MSAL cache,
+    so later invocations skip the token endpoint while the token is valid.
 
     Args:
         config: Configuration object
@@ -178,16 +368,21 @@ def _get_service_principal_token(config) -> str:
     Raises:
         ClientError: If authentication fails
     """
+    from .client import _save_cache, _token_cache
+
     authority = f"https://login.microsoftonline.com/{config.tenant_id}"
     app = ConfidentialClientApplication(
         config.client_id,
         authority=authority,
         client_credential=config.client_secret,
+        token_cache=_token_cache,
     )
 
     # Dataverse scope (different from Power Automate Management API)
     scope = [f"{config.dataverse_url}/.default"]
+    # Served from the persistent cache until the token is close to expiry
     result = app.acquire_token_for_client(scopes=scope)
+    _save_cache()
 
     if "access_token" not in result:
         error = result.get("error_description", result.get("error", "Unknown error"))
@@ -200,6 +395,9 @@ def _get_user_token(config) -> str:
     """
     Get access token using username/password (resource owner password credentials flow).
 
+    A cached token or refresh token for the user is used silently when
+    available, so the password is only sent when the cache has nothing usable.
+
     Note: This flow requires the Azure AD app to have "Allow public client flows" enabled.
 
     Args:
@@ -211,18 +409,29 @@ def _get_user_token(config) -> str:
     Raises:
         ClientError: If authentication fails
     """
+    from .client import _save_cache, _token_cache
+
     authority = f"https://login.microsoftonline.com/{config.tenant_id}"
     app = PublicClientApplication(
         config.client_id,
         authority=authority,
+        token_cache=_token_cache,
     )
 
     scope = [f"{config.dataverse_url}/.default"]
-    result = app.acquire_token_by_username_password(
-        config.username,
-        config.password,
-        scopes=scope
-    )
+
+    # Try the persistent cache (and its refresh token) before sending the password
+    result = None
+    accounts = app.get_accounts(username=config.username)
+    if accounts:
+        result = app.acquire_token_silent(scope, account=accounts[0])
+    if not result:
+        result = app.acquire_token_by_username_password(
+            config.username,
+            config.password,
+            scopes=scope
+        )
+    _save_cache()
 
     if "access_token" not in result:
         error = result.get("error_description", result.get("error", "Unknown error"))
@@ -1,31 +1,62 @@
 """Main entry point for Power Automate CLI."""
 import sys
 import typer
+from importlib import import_module
 from typing import Optional
+from typer.core import TyperGroup
 
 from .output import ClientError
 
+# Command modules, in display order, with the help shown in the command list
+_COMMANDS = {
+    "flow": "Manage Power Automate flows via Management API",
+    "connector": "Manage Power Automate connectors (custom and managed)",
+    "solution": "Manage Power Platform solutions",
+    "connection": "Manage Power Automate connections",
+    "user": "Manage Power Platform users and application users",
+    "openapi": "OpenAPI specification validation and manipulation",
+}
+
+
+class _LazyGroup(TyperGroup):
+    """
+    Top-level command group that imports command modules on first use.
+
+    Importing every command module pulls in requests, msal and the API
+    clients, so only the module for the invoked command is loaded.
+    Listing commands (e.g. --help) still loads them all for their help.
+    """
+
+    def list_commands(self, ctx):
+        return [*super().list_commands(ctx), *(name for name in _COMMANDS if name not in self.commands)]
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in _COMMANDS:
+            module = import_module(f".commands.{cmd_name}", __package__)
+            wrapper = typer.Typer()
+            wrapper.add_typer(module.app, name=cmd_name, help=_COMMANDS[cmd_name])
+            command = typer.main.get_command(wrapper).commands[cmd_name]
+            self.add_command(command, cmd_name)
+        return command
+
+
 # Create main Typer app
 app = typer.Typer(
     name="powerautomate",
     help="CLI interface for Microsoft Power Automate Management API - Properly create and manage flows",
     no_args_is_help=True,
     add_completion=True,
+    cls=_LazyGroup,
 )
 
 
-# Import and register command modules
-try:
-    from .commands import flow, connector, solution, connection, user, openapi
-    app.add_typer(flow.app, name="flow", help="Manage Power Automate flows via Management API")
-    app.add_typer(connector.app, name="connector", help="Manage Power Automate connectors (custom and managed)")
-    app.add_typer(solution.app, name="solution", help="Manage Power Platform solutions")
-    app.add_typer(connection.app, name="connection", help="Manage Power Automate connections")
-    app.add_typer(user.app, name="user", help="Manage Power Platform users and application users")
-    app.add_typer(openapi.app, name="openapi", help="OpenAPI specification validation and manipulation")
-except ImportError:
-    # Commands not yet implemented - will add as we build them
-    pass
+def _show_version(value: bool):
+    """Print the version and exit while options are parsed."""
+    if value:
+        from . import __version__
+        typer.echo(f"powerautomate-cli version {__version__}")
+        raise typer.Exit()
 
 
 @app.callback()
@@ -36,6 +67,7 @@ def callback(
         "--version",
         "-v",
         help="Show version and exit",
+        callback=_show_version,
         is_eager=True,
     ),
     file: Optional[str] = typer.Option(
@@ -81,11 +113,6 @@ def callback(
         powerautomate --raw flow get <flow-id>
         powerautomate --table flow list
     """
-    if version:
-        from . import __version__
-        typer.echo(f"powerautomate-cli version {__version__}")
-        raise typer.Exit()
-
     # Store parameters in context for access by all commands
     ctx.ensure_object(dict)
     ctx.obj['output_file'] = file
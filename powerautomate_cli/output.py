@@ -1,15 +1,198 @@
 """Output formatting utilities for Power Automate CLI."""
+import csv
 import json
-import re
-from typing import Any, Dict, Optional
-from functools import wraps
-from rich.console import Console
-from rich.table import Table
-from rich.json import JSON
+import sys
+from typing import Any, Dict, Optional, Tuple
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 import typer
 
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install "powerautomate-cli[fast]"
+    orjson = None
 
-console = Console()
+# Second-tier encoder where orjson is unavailable (e.g. on PyPy)
+ujson = None
+if orjson is None:
+    try:
+        import ujson
+    except ImportError:
+        pass
+
+
+# Rich console, created on first use so scripted runs never import rich
+_console = None
+
+# Tables with more rows than this are printed as tab-separated text
+_RICH_TABLE_MAX_ROWS = 1000
+
+# Write buffer for JSON streamed to a file chunk by chunk
+_STREAM_BUFFER_SIZE = 1 << 20
+
+
+def dumps_json(data: Any, indent: Optional[int] = 2, ensure_ascii: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+
+    Uses orjson when it is installed, then ujson, and falls back to the
+    standard library json module otherwise (or for indent widths orjson does
+    not support). All encoders escape control characters, so the output is
+    always valid JSON.
+
+    Args:
+        data: Data to serialize
+        indent: Number of spaces for indentation (None for compact output)
+        ensure_ascii: Escape all non-ASCII characters, for consumers that
+            cannot read UTF-8 (orjson cannot do this, so it is skipped)
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None and indent in (None, 2) and not ensure_ascii:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=str, option=option)
+        except TypeError:
+            # orjson.JSONEncodeError (e.g. integers wider than 64 bits)
+            pass
+    elif ujson is not None:
+        try:
+            return ujson.dumps(
+                data, indent=indent or 0, ensure_ascii=ensure_ascii, escape_forward_slashes=False, default=str
+            ).encode("utf-8")
+        except (TypeError, ValueError, OverflowError):
+            pass
+    # Lone surrogates can only occur inside string literals, where the
+    # backslashreplace form (\udXXX) is exactly their JSON escape
+    return _json_encoder(indent, ensure_ascii).encode(data).encode("utf-8", "backslashreplace")
+
+
+@lru_cache(maxsize=None)
+def _json_encoder(indent: Optional[int], ensure_ascii: bool = False) -> json.JSONEncoder:
+    """
+    Get a reusable standard library encoder for an indent width.
+
+    json.dumps() builds a new encoder on every call that passes options;
+    the encoder holds no per-call state, so one instance per setting is shared.
+    """
+    return json.JSONEncoder(indent=indent, default=str, ensure_ascii=ensure_ascii)
+
+
+def _stream_json(data: Any, out, indent: Optional[int], ensure_ascii: bool) -> None:
+    """
+    Write data as UTF-8 JSON to a binary stream without building the whole document.
+
+    Args:
+        data: Data to serialize
+        out: Binary file object
+        indent: Number of spaces for indentation
+        ensure_ascii: Escape all non-ASCII characters
+    """
+    for chunk in _json_encoder(indent, ensure_ascii).iterencode(data):
+        out.write(chunk.encode("utf-8", "backslashreplace"))
+
+
+def _save_json(data: Any, path: str, indent: Optional[int] = 2, ensure_ascii: bool = False) -> None:
+    """
+    Write data as UTF-8 JSON to a file.
+
+    Without a native encoder the document is streamed chunk by chunk through
+    a large write buffer instead of being built in memory first. Bytes are
+    taken as an already-encoded document and written as-is.
+
+    Args:
+        data: Data to serialize, or encoded bytes
+        path: Output file path
+        indent: Number of spaces for indentation
+        ensure_ascii: Escape all non-ASCII characters
+    """
+    if isinstance(data, bytes):
+        with open(path, 'wb') as f:
+            f.write(data)
+    elif orjson is None and ujson is None:
+        # iterencode() yields many tiny chunks; coalesce them into large writes
+        with open(path, 'wb', buffering=_STREAM_BUFFER_SIZE) as f:
+            _stream_json(data, f, indent, ensure_ascii)
+    else:
+        with open(path, 'wb') as f:
+            f.write(dumps_json(data, indent=indent, ensure_ascii=ensure_ascii))
+
+
+def loads_json(data: Any) -> Any:
+    """
+    Parse a JSON document.
+
+    Uses orjson when it is installed and falls back to the standard library
+    json module otherwise. Both raise a json.JSONDecodeError subclass on
+    malformed input.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_stdout(data: bytes) -> None:
+    """
+    Write an encoded document to standard output, ending it with a newline.
+
+    Writes straight to the binary buffer to avoid decoding the serialized
+    JSON back into a str only for print() to encode it again. Falls back to
+    the text layer when stdout has no binary buffer (e.g. when replaced in
+    tests). A document that already ends with a newline (e.g. a
+    caller-supplied string) does not get a second one.
+
+    Args:
+        data: UTF-8 encoded output
+    """
+    newline = data[-1:] != b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8") + ("\n" if newline else ""))
+        return
+    # Keep ordering with anything already written through the text layer
+    sys.stdout.flush()
+    buffer.write(data)
+    if newline:
+        buffer.write(b"\n")
+    buffer.flush()
+
+
+def _print_json(data: Any, indent: Optional[int] = 2, ensure_ascii: bool = False) -> None:
+    """
+    Write data as UTF-8 JSON to standard output, ending it with a newline.
+
+    Without a native encoder the document is streamed chunk by chunk into the
+    buffered binary stdout instead of being built in memory first. Bytes are
+    taken as an already-encoded document and written as-is.
+
+    Args:
+        data: Data to serialize, or encoded bytes
+        indent: Number of spaces for indentation
+        ensure_ascii: Escape all non-ASCII characters
+    """
+    if isinstance(data, bytes):
+        _write_stdout(data)
+        return
+
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is None and ujson is None and buffer is not None:
+        # Keep ordering with anything already written through the text layer
+        sys.stdout.flush()
+        _stream_json(data, buffer, indent, ensure_ascii)
+        buffer.write(b"\n")
+        buffer.flush()
+        return
+
+    _write_stdout(dumps_json(data, indent=indent, ensure_ascii=ensure_ascii))
 
 
 # Shared file output option that can be added to any command
@@ -22,7 +205,8 @@ file_option = typer.Option(
 )
 
 
-def output_json(data: Any, ctx: Optional[typer.Context] = None, file: Optional[str] = None, indent: int = 2):
+def output_json(data: Any, ctx: Optional[typer.Context] = None, file: Optional[str] = None, indent: int = 2,
+                ensure_ascii: bool = False):
     """
     Output data as formatted JSON to console or file.
 
@@ -31,10 +215,12 @@ def output_json(data: Any, ctx: Optional[typer.Context] = None, file: Optional[s
     2. Context object (for global --file parameter)
 
     Args:
-        data: Data to output as JSON
+        data: Data to output as JSON, or an already-encoded JSON document
+            (str or any bytes-like object)
         ctx: Optional Typer context
         file: Optional file path to save JSON to (overrides context)
         indent: Number of spaces for indentation
+        ensure_ascii: Escape non-ASCII characters, for consumers that cannot read UTF-8
     """
     # Determine output file (direct parameter takes precedence)
     output_file = file
@@ -43,71 +229,145 @@ def output_json(data: Any, ctx: Optional[typer.Context] = None, file: Optional[s
     if output_file is None and ctx and ctx.obj:
         output_file = ctx.obj.get('output_file')
 
-    # Convert data to JSON string
-    if isinstance(data, str):
-        json_str = data
-    else:
-        # Use ensure_ascii=True to properly escape control characters (U+0000-U+001F)
-        # This ensures valid JSON output even when API responses contain invalid characters
-        json_str = json.dumps(data, indent=indent, default=str, ensure_ascii=True)
+    # Already-serialized documents are written as-is
+    if isinstance(data, (bytearray, memoryview)):
+        data = bytes(data)
+    elif isinstance(data, str):
+        data = data.encode("utf-8")
 
-    # Output to file or console
+    # Output to file or console; without a native encoder both stream the
+    # document rather than holding it in memory first
     if output_file:
-        with open(output_file, 'w') as f:
-            f.write(json_str)
+        _save_json(data, output_file, indent, ensure_ascii)
         print_success(f"JSON saved to {output_file}")
     else:
-        # Print JSON string directly without Rich formatting
-        # Rich's JSON() class re-parses JSON which causes issues with control characters
-        # json.dumps() with ensure_ascii=True properly escapes them, so we print directly
-        print(json_str)
+        _print_json(data, indent, ensure_ascii)
 
 
 # Backwards compatibility alias
 print_json = output_json
 
 
-def print_table(data: list[Dict[str, Any]], columns: list[str]):
+def print_table(data: list, columns: list[str]):
     """
     Print data as a formatted table.
 
     Args:
-        data: List of dictionaries to display
+        data: List of dictionaries, or of tuples aligned with columns
         columns: Column names to display
     """
     if not data:
-        console.print("[yellow]No data found[/yellow]")
+        typer.secho("No data found", fg=typer.colors.YELLOW)
         return
 
+    _print_rows(data, columns)
+
+
+def _print_rows(data: list, columns: list[str]):
+    """
+    Print table rows to the console.
+
+    Rich measures every cell to lay out its columns, which dominates the run
+    time of large tables, so tables over _RICH_TABLE_MAX_ROWS rows are
+    printed as plain tab-separated text instead.
+
+    Args:
+        data: List of dictionaries, or of tuples aligned with columns
+        columns: Column names to display
+    """
+    if len(data) > _RICH_TABLE_MAX_ROWS:
+        writer = csv.writer(sys.stdout, dialect="excel-tab", lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(_row_cells(row, columns) for row in data)
+        return
+
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold magenta")
 
     for col in columns:
         table.add_column(col, no_wrap=False, overflow="fold")
 
     for row in data:
-        table.add_row(*[str(row.get(col, "")) for col in columns])
+        table.add_row(*_row_cells(row, columns))
+
+    _get_console().print(table)
+
+
+def _get_console():
+    """
+    Get or create the shared rich console.
+
+    Returns:
+        Console: Shared console instance
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
-    console.print(table)
+
+def _row_cells(row: Any, columns: list[str]) -> list[str]:
+    """
+    Render one table row as cell strings.
+
+    Args:
+        row: Dictionary keyed by column, or tuple of values aligned with columns
+        columns: Column names to display
+
+    Returns:
+        Cell strings in column order
+    """
+    if isinstance(row, tuple):
+        return [str(value) for value in row]
+    return [str(row.get(col, "")) for col in columns]
+
+
+# Status line templates, styled once at import; typer.echo strips the
+# colour codes when not writing to a terminal
+_SUCCESS_TEMPLATE = typer.style("✓", fg=typer.colors.GREEN) + " {}"
+_ERROR_TEMPLATE = typer.style("✗", fg=typer.colors.RED) + " {}"
+_WARNING_TEMPLATE = typer.style("⚠", fg=typer.colors.YELLOW) + " {}"
+_INFO_TEMPLATE = typer.style("ℹ", fg=typer.colors.BLUE) + " {}"
 
 
 def print_success(message: str):
     """Print a success message."""
-    console.print(f"[green]✓[/green] {message}")
+    typer.echo(_SUCCESS_TEMPLATE.format(message))
 
 
 def print_error(message: str):
     """Print an error message."""
-    console.print(f"[red]✗[/red] {message}")
+    typer.echo(_ERROR_TEMPLATE.format(message))
 
 
 def print_warning(message: str):
     """Print a warning message."""
-    console.print(f"[yellow]⚠[/yellow] {message}")
+    typer.echo(_WARNING_TEMPLATE.format(message))
 
 
 def print_info(message: str):
     """Print an info message."""
-    console.print(f"[blue]ℹ[/blue] {message}")
+    typer.echo(_INFO_TEMPLATE.format(message))
+
+
+def require_interactive(option: str):
+    """
+    Fail fast instead of prompting for confirmation without a terminal.
+
+    A prompt on a piped or closed stdin would hang or read garbage, so
+    scripts must pass the flag that skips it.
+
+    Args:
+        option: Flag that skips the prompt (e.g. --yes)
+
+    Raises:
+        typer.Exit: With exit code 2 if stdin is not a terminal
+    """
+    if not sys.stdin.isatty():
+        print_error(f"Refusing to prompt for confirmation in non-interactive mode; pass {option}")
+        raise typer.Exit(2)
 
 
 class ClientError(Exception):
@@ -115,6 +375,40 @@ class ClientError(Exception):
     pass
 
 
+class RateLimitError(ClientError):
+    """Exception raised when the API keeps throttling a request (HTTP 429/503)."""
+    pass
+
+
+# Exit code and message prefix per exception class; subclasses inherit
+# the entry of their nearest listed base class
+_ERROR_CLASSES: Dict[type, Tuple[int, str]] = {
+    ClientError: (2, ""),
+    ValueError: (1, "Invalid input: "),
+}
+
+
+@lru_cache(maxsize=128)
+def _classify_error(error_type: type) -> Tuple[int, str]:
+    """
+    Map an exception type to its exit code and message prefix.
+
+    Walks the class's MRO and returns the first match in _ERROR_CLASSES.
+    Classification depends only on the exception class, so the result is
+    cached to keep bulk operations that fail repeatedly cheap.
+
+    Args:
+        error_type: Exception class to classify
+
+    Returns:
+        Tuple of (exit code, message prefix)
+    """
+    for cls in error_type.__mro__:
+        if cls in _ERROR_CLASSES:
+            return _ERROR_CLASSES[cls]
+    return 1, "Unexpected error: "
+
+
 def handle_api_error(error: Exception) -> int:
     """
     Handle API errors and print appropriate messages.
@@ -125,40 +419,57 @@ def handle_api_error(error: Exception) -> int:
     Returns:
         Exit code (1 for API errors, 2 for client errors)
     """
-    if isinstance(error, ClientError):
-        print_error(str(error))
-        return 2
-    elif isinstance(error, ValueError):
-        print_error(f"Invalid input: {error}")
-        return 1
-    else:
-        print_error(f"Unexpected error: {error}")
-        return 1
+    exit_code, prefix = _classify_error(type(error))
+    print_error(f"{prefix}{error}")
+    return exit_code
+
+
+@contextmanager
+def api_errors():
+    """
+    Report expected command failures and exit with the matching exit code.
+
+    Catches ClientError, ValueError (including JSON decode errors) and
+    OSError (including requests exceptions and file errors), prints them via
+    handle_api_error and raises typer.Exit. typer.Exit and programming errors
+    pass through unchanged.
+
+    Raises:
+        typer.Exit: With the exit code from handle_api_error
+    """
+    try:
+        yield
+    except (ClientError, ValueError, OSError) as e:
+        raise typer.Exit(handle_api_error(e))
 
 
 def _clean_metadata(data: Any) -> Any:
     """
-    Recursively remove @odata metadata fields from response data.
+    Remove @odata metadata fields from response data, in place.
+
+    Walks nested dictionaries and lists with an explicit stack and deletes
+    metadata keys from the existing objects rather than copying every node.
+    Callers pass freshly parsed responses, so mutating them is safe.
 
     Args:
         data: Data to clean (dict, list, or primitive)
 
     Returns:
-        Cleaned data with @odata fields removed
-    """
-    if isinstance(data, dict):
-        # Remove @odata fields and recursively clean nested objects
-        cleaned = {}
-        for k, v in data.items():
-            if not k.startswith("@odata"):
-                cleaned[k] = _clean_metadata(v)
-        return cleaned
-    elif isinstance(data, list):
-        # Recursively clean list items
-        return [_clean_metadata(item) for item in data]
-    else:
-        # Return primitives unchanged
-        return data
+        The same data with @odata fields removed
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key in [key for key in node if key.startswith("@odata")]:
+                del node[key]
+            values = node.values()
+        elif isinstance(node, list):
+            values = node
+        else:
+            continue
+        stack.extend(value for value in values if isinstance(value, (dict, list)))
+    return data
 
 
 def _infer_columns(data: list[Dict[str, Any]]) -> list[str]:
@@ -176,6 +487,10 @@ def _infer_columns(data: list[Dict[str, Any]]) -> list[str]:
     return list(data[0].keys())
 
 
+# Global output flags used when a command runs without the main callback
+_OUTPUT_DEFAULTS: Dict[str, Any] = {'output_raw': False, 'output_table': False, 'output_file': None}
+
+
 def format_response(data: Any, ctx: typer.Context, columns: Optional[list[str]] = None):
     """
     Universal output function for all Power Automate CLI commands.
@@ -189,15 +504,28 @@ def format_response(data: Any, ctx: typer.Context, columns: Optional[list[str]]
     Args:
         data: Raw API response data
         ctx: Typer context containing global flags
-        columns: Optional column list for table output (auto-inferred if not provided)
+        columns: Optional column list for table output (auto-inferred if not provided).
+            Rows may be tuples aligned with columns, or a generator of them;
+            they are turned into dictionaries for JSON output.
     """
     # Get flags from context
-    output_raw = ctx.obj.get('output_raw', False) if ctx and ctx.obj else False
-    output_table = ctx.obj.get('output_table', False) if ctx and ctx.obj else False
-    output_file = ctx.obj.get('output_file') if ctx and ctx.obj else None
-
-    # Step 1: Clean metadata (unless --raw flag is set)
-    if not output_raw:
+    options = (ctx.obj if ctx else None) or _OUTPUT_DEFAULTS
+    output_raw = options.get('output_raw', False)
+    output_table = options.get('output_table', False)
+    output_file = options.get('output_file')
+
+    # Projected rows may arrive as a generator; walk it exactly once
+    if columns and not isinstance(data, (list, dict, str)):
+        data = list(data)
+
+    # Tuple rows are only rendered as-is in a console table
+    projected = columns and isinstance(data, list) and data and isinstance(data[0], tuple)
+    if projected and (not output_table or output_file):
+        data = [dict(zip(columns, row)) for row in data]
+
+    # Step 1: Clean metadata (unless --raw flag is set); projected rows
+    # never carry @odata fields, so they are not copied a second time
+    if not output_raw and not projected:
         data = _clean_metadata(data)
 
     # Step 2: Determine output format and generate output
@@ -217,36 +545,20 @@ def format_response(data: Any, ctx: typer.Context, columns: Optional[list[str]]
             columns = _infer_columns(table_data)
 
         if not table_data:
-            output_text = "No data found"
+            payload = b"No data found"
+        elif output_file:
+            # Rich doesn't have great file export, so save the rows as JSON instead
+            payload = table_data
         else:
-            # Generate table
-            table = Table(show_header=True, header_style="bold magenta")
-            for col in columns:
-                table.add_column(col, no_wrap=False, overflow="fold")
-
-            for row in table_data:
-                table.add_row(*[str(row.get(col, "")) for col in columns])
-
-            # Output table
-            if output_file:
-                # For file output, convert table to text representation
-                # Rich doesn't have great file export, so convert to JSON instead
-                output_text = json.dumps(table_data, indent=2, default=str, ensure_ascii=True)
-            else:
-                # Print table to console
-                console.print(table)
-                return
+            _print_rows(table_data, columns)
+            return
     else:
         # JSON output
-        if isinstance(data, str):
-            output_text = data
-        else:
-            output_text = json.dumps(data, indent=2, default=str, ensure_ascii=True)
+        payload = data.encode("utf-8") if isinstance(data, str) else data
 
     # Step 3: Output to file or console
     if output_file:
-        with open(output_file, 'w') as f:
-            f.write(output_text)
+        _save_json(payload, output_file)
         print_success(f"Output saved to {output_file}")
     else:
-        print(output_text)
+        _print_json(payload)
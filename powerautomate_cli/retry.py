@@ -0,0 +1,105 @@
+"""Retry helpers for throttled API requests."""
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Mapping, Optional
+
+import requests
+
+from .output import RateLimitError, print_info
+
+
+# Status codes returned by the service when a request is throttled
+RETRY_STATUS_CODES = frozenset({429, 503})
+
+# Methods that are safe to resend after a 503, which the service may return
+# after it has already applied the request
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Maximum number of attempts (including the first) for a throttled request
+MAX_ATTEMPTS = 5
+
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None,
+                  initial: float = 1.0, maximum: float = 30.0) -> float:
+    """
+    Compute how long to wait before retrying a throttled request.
+
+    A Retry-After header (seconds or HTTP date) takes precedence; otherwise
+    the delay grows exponentially with full jitter.
+
+    Args:
+        attempt: Number of the attempt that was throttled (1-based)
+        retry_after: Value of the Retry-After response header, if any
+        initial: Base delay in seconds
+        maximum: Upper bound for the delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), maximum)
+        except ValueError:
+            try:
+                until = parsedate_to_datetime(retry_after)
+                return min(max((until - datetime.now(timezone.utc)).total_seconds(), 0.0), maximum)
+            except (TypeError, ValueError):
+                pass
+
+    return random.uniform(0, min(maximum, initial * 2 ** (attempt - 1)))
+
+
+def retry_status_codes(method: str, headers: Optional[Mapping[str, str]] = None) -> frozenset:
+    """
+    Get the throttling status codes a request may be retried on.
+
+    429 means the request was rejected before being processed, so it is
+    always retried. 503 is only retried for idempotent requests: those
+    using an idempotent method, and PATCH requests guarded by If-Match.
+
+    Args:
+        method: HTTP method of the request
+        headers: Request headers (case-insensitive mapping)
+
+    Returns:
+        Status codes to retry on
+    """
+    method = method.upper()
+    if method in IDEMPOTENT_METHODS or (method == "PATCH" and headers and "If-Match" in headers):
+        return RETRY_STATUS_CODES
+    return frozenset({429})
+
+
+def send_with_retry(send: Callable[[], requests.Response],
+                    max_attempts: int = MAX_ATTEMPTS,
+                    retry_statuses: frozenset = RETRY_STATUS_CODES) -> requests.Response:
+    """
+    Send a request, retrying with backoff while it is throttled.
+
+    Args:
+        send: Callable that performs the request and returns the response
+        max_attempts: Maximum number of attempts
+        retry_statuses: Status codes to retry on (see retry_status_codes())
+
+    Returns:
+        The first response that is not throttled
+
+    Raises:
+        RateLimitError: If the request is still throttled after max_attempts
+    """
+    for attempt in range(1, max_attempts + 1):
+        response = send()
+        if response.status_code not in retry_statuses:
+            return response
+
+        if attempt == max_attempts:
+            raise RateLimitError(
+                f"HTTP {response.status_code}: Request throttled after {max_attempts} attempts: {response.text}"
+            )
+
+        delay = backoff_delay(attempt, response.headers.get("Retry-After"))
+        print_info(f"Throttled (HTTP {response.status_code}), retrying in {delay:.1f}s "
+                   f"(attempt {attempt + 1}/{max_attempts})")
+        time.sleep(delay)